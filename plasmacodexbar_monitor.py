@@ -21,22 +21,60 @@ try:
 except:
     HAS_APPINDICATOR = False
 
-from gi.repository import Gtk, Gdk, GLib, GdkPixbuf
+try:
+    gi.require_version('Rsvg', '2.0')
+    from gi.repository import Rsvg
+    HAS_RSVG = True
+except (ValueError, ImportError):
+    HAS_RSVG = False
+
+from gi.repository import Gtk, Gdk, Gio, GLib, GdkPixbuf
+import base64
+import functools
+import hashlib
 import json
+import logging
 import os
 import sys
 import tempfile
+import threading
+import time
 import webbrowser
-import urllib.request
+import http.client
+import io
+import ssl
+import string
 import urllib.error
+import urllib.parse
+import urllib.request
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, List
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Any, List, Tuple
 import cairo
 import subprocess
 import math
 
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# orjson is an optional, much faster JSON decoder; fall back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
 # ============================================================================
 # Constants
 # ============================================================================
@@ -51,6 +89,12 @@ CODEX_DIR = Path.home() / ".codex"
 
 ICON_DIR = Path(tempfile.gettempdir()) / "ai-usage-monitor-icons"
 
+# Persistent per-session token totals for Codex session files
+CODEX_SESSION_INDEX_FILE = CONFIG_DIR / "codex-session-index.json"
+SESSION_INDEX_VERSION = 3
+# Sessions modified this recently are re-checked even when the day walk stops early
+SESSION_ACTIVE_WINDOW_NS = 24 * 3600 * 10**9
+
 # Claude OAuth API
 CLAUDE_OAUTH_API_URL = "https://api.anthropic.com/api/oauth/usage"
 CLAUDE_OAUTH_BETA_HEADER = "oauth-2025-04-20"
@@ -58,18 +102,187 @@ CLAUDE_OAUTH_BETA_HEADER = "oauth-2025-04-20"
 # Codex OAuth API
 CODEX_OAUTH_API_URL = "https://chatgpt.com/backend-api/wham/usage"
 
+# How often to check whether OAuth tokens need a proactive refresh (seconds)
+TOKEN_REFRESH_CHECK_INTERVAL = 3600
+
+# Claude pricing per 1M tokens (rough average), used for local cost estimates
+_CLAUDE_PRICING = MappingProxyType({
+    "claude-opus-4-5-20251101": MappingProxyType({"input": 15.0, "output": 75.0, "cache_read": 1.5, "cache_write": 18.75}),
+    "claude-sonnet-4-5-20250929": MappingProxyType({"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75}),
+})
+_CLAUDE_DEFAULT_PRICING = MappingProxyType({"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75})
+_INV_MILLION = 1e-6
+
+# Per-token (input, output, cache_read, cache_write) rates derived from the tables above
+_MODEL_RATE_TUPLES = MappingProxyType({
+    model_id: (p["input"] * _INV_MILLION, p["output"] * _INV_MILLION,
+               p["cache_read"] * _INV_MILLION, p["cache_write"] * _INV_MILLION)
+    for model_id, p in _CLAUDE_PRICING.items()
+})
+_DEFAULT_RATE_TUPLE = (
+    _CLAUDE_DEFAULT_PRICING["input"] * _INV_MILLION, _CLAUDE_DEFAULT_PRICING["output"] * _INV_MILLION,
+    _CLAUDE_DEFAULT_PRICING["cache_read"] * _INV_MILLION, _CLAUDE_DEFAULT_PRICING["cache_write"] * _INV_MILLION,
+)
+
+# Upper bound on how long a usage API response is served from memory (seconds)
+USAGE_CACHE_TTL = 30
+
+
+# ============================================================================
+# HTTP Connection Pool
+# ============================================================================
+
+# Redirect statuses followed by HTTPConnectionPool, as urllib does
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[str]:
+    """Proxy URL from the environment (https_proxy, no_proxy, ...) for a host"""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else "http://" + proxy
+
+
+class HTTPConnectionPool:
+    """Keep-alive pool of http.client connections, keyed by scheme and host.
+
+    urllib opens a new TCP+TLS connection for every request; reusing idle
+    connections saves a full handshake per provider on every refresh tick.
+    Like urlopen, it honours the *_proxy environment variables (HTTPS
+    through a CONNECT tunnel) and follows redirects. Any other status
+    from 300 up, except 304, raises urllib.error.HTTPError so callers
+    keep their existing error handling.
+    """
+
+    def __init__(self, max_idle_per_host: int = 2):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[tuple, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def _acquire(self, key: tuple, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, proxy = key
+        if proxy:
+            proxy_parts = urllib.parse.urlsplit(proxy)
+            proxy_host = proxy_parts.netloc.rpartition("@")[2]
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(proxy_host, timeout=timeout, context=self._ssl_context)
+                conn.set_tunnel(host, headers=self._proxy_headers(proxy_parts))
+                return conn, False
+            return http.client.HTTPConnection(proxy_host, timeout=timeout), False
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=timeout, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, timeout=timeout), False
+
+    @staticmethod
+    def _proxy_headers(proxy_parts) -> Dict[str, str]:
+        if proxy_parts.username is None:
+            return {}
+        credentials = "%s:%s" % (urllib.parse.unquote(proxy_parts.username),
+                                 urllib.parse.unquote(proxy_parts.password or ""))
+        return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode("ascii")}
+
+    def _release(self, key: tuple, conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method: str, url: str, headers: Dict[str, str],
+              body: Optional[bytes], timeout: float) -> Tuple[http.client.HTTPResponse, bytes]:
+        """One request/response exchange on a pooled connection"""
+        parts = urllib.parse.urlsplit(url)
+        proxy = _proxy_for(parts.scheme, parts.hostname or "")
+        key = (parts.scheme, parts.netloc, proxy)
+        if proxy and parts.scheme == "http":
+            # Plain HTTP goes to the proxy with the absolute URL
+            path = url
+            headers = {**headers, **self._proxy_headers(urllib.parse.urlsplit(proxy))}
+        else:
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+        for attempt in range(2):
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # The server may have dropped an idle keep-alive connection;
+                # retry once on a fresh one.
+                if reused and attempt == 0:
+                    continue
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return response, data
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                body: Optional[bytes] = None, timeout: float = 30) -> Tuple[int, Any, bytes]:
+        """Perform a request and return (status, headers, body)"""
+        headers = headers or {}
+        for _ in range(MAX_REDIRECTS + 1):
+            response, data = self._send(method, url, headers, body, timeout)
+            location = response.headers.get("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                break
+            # Same rules as urllib: 307/308 only replay GET and HEAD, the
+            # others turn the request into a bodyless GET
+            if response.status in (307, 308) and method not in ("GET", "HEAD"):
+                break
+            if response.status not in (307, 308) and method != "HEAD":
+                method, body = "GET", None
+                headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+            url = urllib.parse.urljoin(url, location)
+
+        if response.status >= 300 and response.status != 304:
+            raise urllib.error.HTTPError(url, response.status, response.reason,
+                                         response.headers, io.BytesIO(data))
+        return response.status, response.headers, data
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+# Global connection pool shared by all fetchers
+http_pool = HTTPConnectionPool()
+
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProviderStats:
     """Statistics for a single AI provider"""
     provider_id: str = ""
     provider_name: str = ""
     is_connected: bool = False
     last_update: Optional[datetime] = None
+    # time.monotonic() at last_update, for cheap "updated ago" math
+    last_update_monotonic: Optional[float] = None
     error_message: str = ""
 
     # Plan info
@@ -107,13 +320,142 @@ class ProviderStats:
     total_sessions: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AppConfig:
     """Application configuration"""
     refresh_interval: int = 60
+    # Bounds for the adaptive refresh delay (seconds)
+    min_refresh_interval: int = 30
+    max_refresh_interval: int = 600
     enabled_providers: List[str] = field(default_factory=lambda: ["claude", "codex"])
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+# datetime.fromisoformat only understands a trailing 'Z' from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (a trailing 'Z' is allowed); None if invalid"""
+    if not value or not isinstance(value, str):
+        return None
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _format_tokens(tokens: int) -> str:
+    """Short token count for display, e.g. 1.2M"""
+    if tokens >= 1_000_000_000:
+        return f"{tokens / 1_000_000_000:.1f}B"
+    elif tokens >= 1_000_000:
+        return f"{tokens / 1_000_000:.1f}M"
+    elif tokens >= 1_000:
+        return f"{tokens / 1_000:.0f}K"
+    return str(tokens)
+
+
+# ============================================================================
+# Usage Response Cache
+# ============================================================================
+
+def _usage_ttl(seconds_until_reset: Optional[float]) -> float:
+    """TTL for a cached usage response, shrinking as the next reset nears.
+
+    A short TTL close to the reset makes sure the post-reset drop to zero is
+    picked up quickly instead of being masked by a stale response.
+    """
+    if seconds_until_reset is None:
+        return USAGE_CACHE_TTL
+    return max(0.0, min(USAGE_CACHE_TTL, seconds_until_reset / 60))
+
+
+def _ttl_cached(fetch):
+    """Memoize a fetcher's usage API response for a short, reset-aware TTL.
+
+    The cache is keyed by a hash of the call arguments (access token and
+    account), so switching accounts never serves another account's data.
+    Pass force=True to bypass the cache, e.g. for an explicit user refresh.
+    Failed fetches (None) are never cached.
+    """
+    @functools.wraps(fetch)
+    def wrapper(self, *args, force: bool = False):
+        key = hashlib.sha256(repr(args).encode('utf-8')).hexdigest()
+        now = time.monotonic()
+        cached = self._usage_cache
+        if not force and cached and cached[0] == key and now - cached[1] < cached[2]:
+            return cached[3]
+
+        payload = fetch(self, *args)
+        if payload is not None:
+            ttl = _usage_ttl(self._seconds_until_reset(payload))
+            self._usage_cache = (key, now, ttl, payload)
+        return payload
+    return wrapper
+
+
+def _conditional_get_json(fetcher, url: str, headers: Dict[str, str]) -> Optional[dict]:
+    """GET a usage endpoint, revalidating the last response via ETag/Last-Modified.
+
+    The validators of the last 200 response are kept on the fetcher
+    (fetcher._validators) together with its parsed payload; when the server
+    answers 304 Not Modified the payload is reused without a body transfer.
+    Validators are keyed by URL and request headers, so they never leak
+    across accounts.
+    """
+    key = hashlib.sha256(repr((url, sorted(headers.items()))).encode('utf-8')).hexdigest()
+    validators = fetcher._validators
+    if validators and validators[0] != key:
+        validators = None
+
+    request_headers = dict(headers)
+    if validators:
+        if validators[1]:
+            request_headers["If-None-Match"] = validators[1]
+        if validators[2]:
+            request_headers["If-Modified-Since"] = validators[2]
+
+    status, response_headers, body = http_pool.request("GET", url, headers=request_headers, timeout=30)
+    if status == 304 and validators:
+        return validators[3]
+    if status == 200:
+        payload = _loads(body)
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        fetcher._validators = (key, etag, last_modified, payload) if etag or last_modified else None
+        return payload
+    return None
+
+
+def _file_mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _set_pace(stats: "ProviderStats", window: timedelta, now: datetime):
+    """Set the pace fields: weekly usage against the share of the window elapsed"""
+    window_start = stats.weekly_reset_time - window
+    elapsed_seconds = (now - window_start).total_seconds()
+    expected_pct = (elapsed_seconds / window.total_seconds()) * 100
+
+    stats.pace_percentage = stats.weekly_used_pct - expected_pct
+    if stats.pace_percentage < 0:
+        stats.pace_status = f"Behind ({stats.pace_percentage:.0f}%)"
+    elif stats.pace_percentage > 0:
+        stats.pace_status = f"Ahead (+{stats.pace_percentage:.0f}%)"
+    else:
+        stats.pace_status = "On track"
+
+
 # ============================================================================
 # Claude OAuth Usage Fetcher
 # ============================================================================
@@ -121,37 +463,70 @@ class AppConfig:
 class ClaudeOAuthFetcher:
     """Fetches real subscription usage from Claude OAuth API"""
 
+    # Plan detection, in priority order: (substring, display name, also match rateLimitTier)
+    PLAN_RULES = (
+        ("max", "Max", True),
+        ("pro", "Pro", False),
+        ("team", "Team", False),
+    )
+
     def __init__(self):
         self.credentials_file = CLAUDE_DIR / ".credentials.json"
         self.stats_file = CLAUDE_DIR / "stats-cache.json"
+        self._collect_lock = threading.Lock()
+        self._usage_cache = None
+        # (key, ETag, Last-Modified, payload) of the last 200 usage response
+        self._validators: Optional[tuple] = None
+        # (usage payload, file mtimes, stats) of the last parse, reused while unchanged
+        self._last_stats: Optional[tuple] = None
+        # (mtime_ns, parsed value) of the last read, to skip unchanged files
+        self._credentials_cache: Optional[Tuple[int, dict]] = None
+        self._local_stats_cache: Optional[Tuple[tuple, dict]] = None
 
     def _load_credentials(self) -> Optional[dict]:
         """Load OAuth credentials from Claude Code"""
-        if not self.credentials_file.exists():
+        try:
+            mtime_ns = self.credentials_file.stat().st_mtime_ns
+        except OSError:
             return None
+        if self._credentials_cache and self._credentials_cache[0] == mtime_ns:
+            return self._credentials_cache[1]
         try:
             with open(self.credentials_file, 'r') as f:
                 data = json.load(f)
-                return data.get("claudeAiOauth", {})
+                creds = data.get("claudeAiOauth", {})
         except Exception:
             return None
+        self._credentials_cache = (mtime_ns, creds)
+        return creds
 
+    def _seconds_until_reset(self, usage_data: dict) -> Optional[float]:
+        """Seconds until the nearest usage window resets, if known"""
+        now = datetime.now(timezone.utc)
+        remaining = []
+        for key in ("five_hour", "seven_day"):
+            resets_at = (usage_data.get(key) or {}).get("resets_at")
+            if resets_at:
+                reset = _parse_iso(resets_at)
+                if reset is not None:
+                    remaining.append((reset - now).total_seconds())
+        return min(remaining) if remaining else None
+
+    @_ttl_cached
     def _fetch_usage_api(self, access_token: str) -> Optional[dict]:
         """Fetch usage data from Claude OAuth API"""
         try:
-            req = urllib.request.Request(
+            return _conditional_get_json(
+                self,
                 CLAUDE_OAUTH_API_URL,
-                headers={
+                {
                     "Authorization": f"Bearer {access_token}",
                     "anthropic-beta": CLAUDE_OAUTH_BETA_HEADER,
                     "Content-Type": "application/json",
                     "Accept": "application/json",
                     "User-Agent": "AIUsageMonitor/2.1"
-                }
+                },
             )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                if response.status == 200:
-                    return json.loads(response.read().decode('utf-8'))
         except urllib.error.HTTPError as e:
             print(f"Claude API HTTP error: {e.code}")
         except Exception as e:
@@ -159,7 +534,11 @@ class ClaudeOAuthFetcher:
         return None
 
     def _load_local_cost_stats(self) -> dict:
-        """Load cost/token stats from local Claude Code cache"""
+        """Load cost/token stats from local Claude Code cache.
+
+        The result is memoized on the file's mtime (and today's date, since
+        the daily figures depend on it), so an unchanged cache costs one stat().
+        """
         stats = {
             "cost_today": 0.0,
             "cost_today_tokens": 0,
@@ -169,34 +548,34 @@ class ClaudeOAuthFetcher:
             "total_sessions": 0,
         }
 
-        if not self.stats_file.exists():
-            return stats
-
         try:
-            with open(self.stats_file, 'r') as f:
-                data = json.load(f)
+            st = self.stats_file.stat()
+        except OSError:
+            return stats
 
-            # Pricing per 1M tokens (rough average)
-            PRICING = {
-                "claude-opus-4-5-20251101": {"input": 15.0, "output": 75.0, "cache_read": 1.5, "cache_write": 18.75},
-                "claude-sonnet-4-5-20250929": {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75},
-            }
-            DEFAULT_PRICING = {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75}
+        today = datetime.now().date()
+        signature = (st.st_mtime_ns, today)
+        if self._local_stats_cache and self._local_stats_cache[0] == signature:
+            return self._local_stats_cache[1]
 
-            today = datetime.now().date()
-            thirty_days_ago = today - timedelta(days=30)
-
-            # Calculate daily tokens
-            for entry in data.get("dailyModelTokens", []):
-                try:
-                    entry_date = datetime.strptime(entry["date"], "%Y-%m-%d").date()
-                    tokens = sum(entry.get("tokensByModel", {}).values())
-                    if entry_date == today:
-                        stats["cost_today_tokens"] = tokens
-                    if entry_date >= thirty_days_ago:
-                        stats["cost_30_days_tokens"] += tokens
-                except:
-                    continue
+        try:
+            with open(self.stats_file, 'rb') as f:
+                data = _loads(f.read())
+
+            today_s = today.isoformat()
+            cutoff_s = (today - timedelta(days=30)).isoformat()
+
+            # Calculate daily tokens in one pass over the recent entries
+            # (ISO dates compare correctly as strings)
+            daily = [
+                (entry["date"], sum(entry["tokensByModel"].values()))
+                for entry in data.get("dailyModelTokens", [])
+                if isinstance(entry.get("date"), str) and entry["date"] >= cutoff_s
+                and isinstance(entry.get("tokensByModel"), dict)
+            ]
+            stats["cost_30_days_tokens"] = sum(tokens for _, tokens in daily)
+            stats["cost_today_tokens"] = next(
+                (tokens for date, tokens in daily if date == today_s), 0)
 
             # Calculate costs from model usage
             model_usage = data.get("modelUsage", {})
@@ -208,32 +587,40 @@ class ClaudeOAuthFetcher:
                 cache_read = usage.get("cacheReadInputTokens", 0)
                 cache_write = usage.get("cacheCreationInputTokens", 0)
 
-                pricing = PRICING.get(model_id, DEFAULT_PRICING)
-                cost = (
-                    (input_tokens / 1_000_000) * pricing["input"] +
-                    (output_tokens / 1_000_000) * pricing["output"] +
-                    (cache_read / 1_000_000) * pricing["cache_read"] +
-                    (cache_write / 1_000_000) * pricing["cache_write"]
-                )
-                total_cost += cost
+                ri, ro, rr, rw = _MODEL_RATE_TUPLES.get(model_id, _DEFAULT_RATE_TUPLE)
+                total_cost += input_tokens * ri + output_tokens * ro + cache_read * rr + cache_write * rw
 
             stats["cost_30_days"] = total_cost
-            stats["cost_today"] = (stats["cost_today_tokens"] / 1_000_000) * 5  # Rough estimate
+            stats["cost_today"] = stats["cost_today_tokens"] * _INV_MILLION * 5  # Rough estimate
 
             stats["total_messages"] = data.get("totalMessages", 0)
             stats["total_sessions"] = data.get("totalSessions", 0)
 
+            self._local_stats_cache = (signature, stats)
+
         except Exception as e:
             print(f"Error loading local stats: {e}")
 
         return stats
 
-    def collect(self) -> ProviderStats:
-        """Collect Claude usage from OAuth API"""
+    def collect(self, force: bool = False) -> ProviderStats:
+        """Collect Claude usage from OAuth API.
+
+        A usage response served from the TTL cache or revalidated with a 304
+        is the same payload object as last time; the previous parse is then
+        reused and only the timestamps and the time-dependent pace change.
+        """
+        # Serialize collects so the response and local-stats caches are
+        # never updated from two worker threads at once
+        with self._collect_lock:
+            return self._collect(force)
+
+    def _collect(self, force: bool) -> ProviderStats:
         stats = ProviderStats(
             provider_id="claude",
             provider_name="Claude",
         )
+        now = datetime.now(timezone.utc)
 
         # Load credentials
         creds = self._load_credentials()
@@ -248,24 +635,23 @@ class ClaudeOAuthFetcher:
 
         # Check if token is expired
         expires_at = creds.get("expiresAt", 0)
-        if expires_at and datetime.fromtimestamp(expires_at / 1000) < datetime.now():
+        if expires_at and datetime.fromtimestamp(expires_at / 1000, tz=timezone.utc) < now:
             stats.error_message = "Token expired. Run 'claude' to refresh."
             return stats
 
         # Determine plan from credentials
         sub_type = creds.get("subscriptionType", "free")
-        rate_tier = creds.get("rateLimitTier", "")
-        if "max" in rate_tier.lower() or "max" in sub_type.lower():
-            stats.plan_name = "Max"
-        elif "pro" in sub_type.lower():
-            stats.plan_name = "Pro"
-        elif "team" in sub_type.lower():
-            stats.plan_name = "Team"
+        sub_l = sub_type.lower()
+        tier_l = creds.get("rateLimitTier", "").lower()
+        for needle, label, check_tier in self.PLAN_RULES:
+            if needle in sub_l or (check_tier and needle in tier_l):
+                stats.plan_name = label
+                break
         else:
             stats.plan_name = sub_type.title()
 
         # Fetch from OAuth API
-        usage_data = self._fetch_usage_api(access_token)
+        usage_data = self._fetch_usage_api(access_token, force=force)
         if not usage_data:
             stats.error_message = "Failed to fetch usage data from API."
             stats.is_connected = True  # We have credentials, just API failed
@@ -273,28 +659,38 @@ class ClaudeOAuthFetcher:
 
         stats.is_connected = True
         stats.last_update = datetime.now()
+        stats.last_update_monotonic = time.monotonic()
+
+        # A cached or revalidated response is the very same payload object;
+        # with the credential and stats files unchanged as well, so is the parse
+        files_key = (_file_mtime_ns(self.credentials_file), _file_mtime_ns(self.stats_file))
+        last = self._last_stats
+        if last is not None and last[0] is usage_data and last[1] == files_key:
+            stats = replace(last[2], last_update=stats.last_update,
+                            last_update_monotonic=stats.last_update_monotonic)
+        else:
+            self._parse_usage(stats, usage_data)
+            self._last_stats = (usage_data, files_key, stats)
+
+        # Calculate pace; it moves with the clock, so on every collect
+        if stats.weekly_reset_time:
+            _set_pace(stats, timedelta(days=7), now)
+
+        return stats
 
+    def _parse_usage(self, stats: ProviderStats, usage_data: dict):
+        """Fill stats from a usage API payload and the local stats cache"""
         # Parse 5-hour session window
         five_hour = usage_data.get("five_hour", {})
         if five_hour:
             stats.session_used_pct = five_hour.get("utilization", 0.0)
-            resets_at = five_hour.get("resets_at")
-            if resets_at:
-                try:
-                    stats.session_reset_time = datetime.fromisoformat(resets_at.replace('Z', '+00:00'))
-                except:
-                    pass
+            stats.session_reset_time = _parse_iso(five_hour.get("resets_at"))
 
         # Parse 7-day window
         seven_day = usage_data.get("seven_day", {})
         if seven_day:
             stats.weekly_used_pct = seven_day.get("utilization", 0.0)
-            resets_at = seven_day.get("resets_at")
-            if resets_at:
-                try:
-                    stats.weekly_reset_time = datetime.fromisoformat(resets_at.replace('Z', '+00:00'))
-                except:
-                    pass
+            stats.weekly_reset_time = _parse_iso(seven_day.get("resets_at"))
 
         # Parse model-specific quotas (Sonnet/Opus)
         for key in ["seven_day_sonnet", "seven_day_opus"]:
@@ -315,23 +711,6 @@ class ClaudeOAuthFetcher:
                 stats.extra_usage_limit = limit / 100.0
                 stats.extra_usage_pct = extra.get("utilization", 0.0)
 
-        # Calculate pace
-        now = datetime.now(timezone.utc)
-        if stats.weekly_reset_time:
-            # Calculate expected usage based on time through the week
-            week_start = stats.weekly_reset_time - timedelta(days=7)
-            total_seconds = (stats.weekly_reset_time - week_start).total_seconds()
-            elapsed_seconds = (now - week_start).total_seconds()
-            expected_pct = (elapsed_seconds / total_seconds) * 100
-            stats.pace_percentage = stats.weekly_used_pct - expected_pct
-
-            if stats.pace_percentage < 0:
-                stats.pace_status = f"Behind ({stats.pace_percentage:.0f}%)"
-            elif stats.pace_percentage > 0:
-                stats.pace_status = f"Ahead (+{stats.pace_percentage:.0f}%)"
-            else:
-                stats.pace_status = "On track"
-
         # Load local cost stats
         local_stats = self._load_local_cost_stats()
         stats.cost_today = local_stats["cost_today"]
@@ -341,8 +720,6 @@ class ClaudeOAuthFetcher:
         stats.total_messages = local_stats["total_messages"]
         stats.total_sessions = local_stats["total_sessions"]
 
-        return stats
-
 
 # ============================================================================
 # Codex (OpenAI) OAuth Data Collector
@@ -356,6 +733,16 @@ class CodexOAuthFetcher:
     CLIENT_ID = "app_EMoamEEZ73f0CkXaXp7hrann"
     DEFAULT_BASE_URL = "https://chatgpt.com/backend-api"
 
+    # Token refresh thresholds; the background refresher renews a bit early
+    REFRESH_THRESHOLD = timedelta(days=8)
+    PROACTIVE_REFRESH_THRESHOLD = timedelta(days=7, hours=12)
+    # Seconds to wait after a failed refresh before hitting the auth server again
+    REFRESH_RETRY_BACKOFF = 120
+
+    # Shared by every instance: auth.json is per user, not per fetcher
+    _refresh_lock = threading.Lock()
+    _refresh_retry_at = 0.0
+
     # Plan type mappings
     PLAN_DISPLAY_NAMES = {
         "guest": "Guest",
@@ -377,14 +764,40 @@ class CodexOAuthFetcher:
         self.auth_file = CODEX_DIR / "auth.json"
         self.config_file = CODEX_DIR / "config.toml"
         self.sessions_dir = CODEX_DIR / "sessions"
+        self._collect_lock = threading.Lock()
+        self._usage_cache = None
+        # (key, ETag, Last-Modified, payload) of the last 200 usage response
+        self._validators: Optional[tuple] = None
+        # (usage payload, stats) of the last parse, reused while the payload is unchanged
+        self._last_stats: Optional[tuple] = None
+        # (mtime_ns, parsed auth.json) shared by credential loads and saves
+        self._auth_cache: Optional[Tuple[int, dict]] = None
+        self._cached_base_url: Optional[Tuple[Optional[int], str]] = None
+        self.session_index_file = CODEX_SESSION_INDEX_FILE
+        self._session_index: Optional[Dict[str, list]] = None
+        # Newest session mtime seen, and the day of the last full 30-day walk
+        self._session_max_mtime_ns = 0
+        self._session_full_scan_ymd = 0
+
+    def _read_auth_file(self) -> Optional[dict]:
+        """Return the parsed auth.json, re-reading it only when its mtime changes"""
+        try:
+            mtime_ns = self.auth_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        if self._auth_cache and self._auth_cache[0] == mtime_ns:
+            return self._auth_cache[1]
+        with open(self.auth_file, 'r') as f:
+            data = json.load(f)
+        self._auth_cache = (mtime_ns, data)
+        return data
 
     def _load_credentials(self) -> Optional[dict]:
         """Load OAuth credentials from ~/.codex/auth.json"""
-        if not self.auth_file.exists():
-            return None
         try:
-            with open(self.auth_file, 'r') as f:
-                data = json.load(f)
+            data = self._read_auth_file()
+            if data is None:
+                return None
 
             # Check for API key auth
             api_key = data.get("OPENAI_API_KEY") or ""
@@ -407,13 +820,7 @@ class CodexOAuthFetcher:
                 return None
 
             # Parse last_refresh timestamp
-            last_refresh = None
-            last_refresh_str = data.get("last_refresh", "")
-            if last_refresh_str:
-                try:
-                    last_refresh = datetime.fromisoformat(last_refresh_str.replace('Z', '+00:00'))
-                except:
-                    pass
+            last_refresh = _parse_iso(data.get("last_refresh", ""))
 
             return {
                 "access_token": access_token,
@@ -426,24 +833,53 @@ class CodexOAuthFetcher:
             print(f"Error loading Codex credentials: {e}")
             return None
 
-    def _needs_refresh(self, creds: dict) -> bool:
+    def _needs_refresh(self, creds: dict, threshold: timedelta = REFRESH_THRESHOLD) -> bool:
         """Check if token needs refresh (8-day threshold like CodexBar)"""
         if not creds.get("refresh_token"):
             return False
         last_refresh = creds.get("last_refresh")
         if not last_refresh:
             return True
-        eight_days = timedelta(days=8)
         if isinstance(last_refresh, datetime):
-            return datetime.now(timezone.utc) - last_refresh.replace(tzinfo=timezone.utc) > eight_days
+            return datetime.now(timezone.utc) - last_refresh.replace(tzinfo=timezone.utc) > threshold
         return True
 
+    def maybe_refresh_tokens(self):
+        """Proactively renew the OAuth token ahead of the 8-day threshold.
+
+        Meant to run periodically on a worker thread so that collect() never
+        has to pay for the token round-trip itself.
+        """
+        creds = self._load_credentials()
+        if creds and self._needs_refresh(creds, self.PROACTIVE_REFRESH_THRESHOLD):
+            self._refresh_token(creds)
+
     def _refresh_token(self, creds: dict) -> Optional[dict]:
-        """Refresh the OAuth token"""
-        refresh_token = creds.get("refresh_token")
-        if not refresh_token:
+        """Refresh the OAuth token.
+
+        Only one refresh runs at a time. Waiters re-read auth.json once they
+        get the lock and reuse the token the winner saved instead of burning
+        the refresh token a second time.
+        """
+        if not creds.get("refresh_token"):
             return creds
 
+        cls = type(self)
+        with cls._refresh_lock:
+            current = self._load_credentials() or creds
+            if current.get("access_token") != creds.get("access_token"):
+                return current
+            if time.monotonic() < cls._refresh_retry_at:
+                return None
+
+            refreshed = self._do_refresh_token(current)
+            if refreshed is None:
+                cls._refresh_retry_at = time.monotonic() + self.REFRESH_RETRY_BACKOFF
+            return refreshed
+
+    def _do_refresh_token(self, creds: dict) -> Optional[dict]:
+        refresh_token = creds["refresh_token"]
+
         try:
             body = json.dumps({
                 "client_id": self.CLIENT_ID,
@@ -452,27 +888,27 @@ class CodexOAuthFetcher:
                 "scope": "openid profile email",
             }).encode('utf-8')
 
-            req = urllib.request.Request(
+            status, _, response_body = http_pool.request(
+                "POST",
                 self.REFRESH_ENDPOINT,
-                data=body,
                 headers={
                     "Content-Type": "application/json",
                 },
-                method="POST"
+                body=body,
+                timeout=30
             )
 
-            with urllib.request.urlopen(req, timeout=30) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    new_creds = {
-                        "access_token": data.get("access_token", creds["access_token"]),
-                        "refresh_token": data.get("refresh_token", creds["refresh_token"]),
-                        "id_token": data.get("id_token", creds.get("id_token")),
-                        "account_id": creds.get("account_id"),
-                        "last_refresh": datetime.now(timezone.utc),
-                    }
-                    self._save_credentials(new_creds)
-                    return new_creds
+            if status == 200:
+                data = _loads(response_body)
+                new_creds = {
+                    "access_token": data.get("access_token", creds["access_token"]),
+                    "refresh_token": data.get("refresh_token", creds["refresh_token"]),
+                    "id_token": data.get("id_token", creds.get("id_token")),
+                    "account_id": creds.get("account_id"),
+                    "last_refresh": datetime.now(timezone.utc),
+                }
+                self._save_credentials(new_creds)
+                return new_creds
 
         except urllib.error.HTTPError as e:
             print(f"Codex token refresh HTTP error: {e.code}")
@@ -482,12 +918,13 @@ class CodexOAuthFetcher:
         return None
 
     def _save_credentials(self, creds: dict):
-        """Save refreshed credentials back to auth.json"""
+        """Save refreshed credentials back to auth.json.
+
+        The file is replaced atomically (temp file + os.replace) so readers,
+        including the Codex CLI itself, never see a half-written file.
+        """
         try:
-            existing = {}
-            if self.auth_file.exists():
-                with open(self.auth_file, 'r') as f:
-                    existing = json.load(f)
+            existing = dict(self._read_auth_file() or {})
 
             tokens = {
                 "access_token": creds["access_token"],
@@ -502,31 +939,40 @@ class CodexOAuthFetcher:
             existing["last_refresh"] = datetime.now(timezone.utc).isoformat()
 
             self.auth_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.auth_file, 'w') as f:
+            tmp = self.auth_file.with_suffix(".json.tmp")
+            # auth.json holds secrets; keep the replacement private to the user
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
                 json.dump(existing, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.auth_file)
+            self._auth_cache = (self.auth_file.stat().st_mtime_ns, existing)
         except Exception as e:
             print(f"Error saving Codex credentials: {e}")
 
     def _resolve_base_url(self) -> str:
-        """Resolve the ChatGPT base URL from config or use default"""
+        """Resolve the ChatGPT base URL from config or use default.
+
+        config.toml is parsed with tomllib and the result is cached against
+        the file's mtime, so it is only re-read after it changes.
+        """
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if self._cached_base_url and self._cached_base_url[0] == mtime_ns:
+            return self._cached_base_url[1]
+
         base_url = self.DEFAULT_BASE_URL
 
         # Try to read from config.toml
-        if self.config_file.exists():
+        if mtime_ns is not None and tomllib is not None:
             try:
-                with open(self.config_file, 'r') as f:
-                    for line in f:
-                        line = line.split('#')[0].strip()
-                        if not line or '=' not in line:
-                            continue
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        if key == "chatgpt_base_url" and value:
-                            base_url = value
-                            break
-            except:
-                pass
+                with open(self.config_file, 'rb') as f:
+                    value = tomllib.load(f).get("chatgpt_base_url")
+                if isinstance(value, str) and value.strip():
+                    base_url = value.strip()
+            except (OSError, tomllib.TOMLDecodeError) as e:
+                print(f"Error reading Codex config: {e}")
 
         # Normalize URL
         base_url = base_url.rstrip('/')
@@ -534,28 +980,57 @@ class CodexOAuthFetcher:
             if "/backend-api" not in base_url:
                 base_url += "/backend-api"
 
+        self._cached_base_url = (mtime_ns, base_url)
         return base_url
 
-    def _fetch_usage_api(self, access_token: str, account_id: Optional[str]) -> Optional[dict]:
-        """Fetch usage data from Codex/ChatGPT OAuth API"""
+    def _request_usage(self, access_token: str, account_id: Optional[str]) -> Optional[dict]:
+        """Issue a single usage request; HTTP errors propagate to the caller"""
         base_url = self._resolve_base_url()
         usage_path = "/wham/usage" if "/backend-api" in base_url else "/api/codex/usage"
         usage_url = base_url + usage_path
 
-        try:
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "User-Agent": "AIUsageMonitor/2.1",
-                "Accept": "application/json",
-            }
-            if account_id:
-                headers["ChatGPT-Account-Id"] = account_id
-
-            req = urllib.request.Request(usage_url, headers=headers)
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "User-Agent": "AIUsageMonitor/2.1",
+            "Accept": "application/json",
+        }
+        if account_id:
+            headers["ChatGPT-Account-Id"] = account_id
+
+        return _conditional_get_json(self, usage_url, headers)
+
+    def _seconds_until_reset(self, usage_data: dict) -> Optional[float]:
+        """Seconds until the nearest rate-limit window resets, if known"""
+        now = time.time()
+        rate_limit = usage_data.get("rate_limit") or {}
+        remaining = []
+        for key in ("primary_window", "secondary_window"):
+            reset_at = (rate_limit.get(key) or {}).get("reset_at")
+            if isinstance(reset_at, (int, float)):
+                remaining.append(reset_at - now)
+        return min(remaining) if remaining else None
+
+    @_ttl_cached
+    def _fetch_usage_api(self, access_token: str, account_id: Optional[str]) -> Optional[dict]:
+        """Fetch usage data from Codex/ChatGPT OAuth API.
 
-            with urllib.request.urlopen(req, timeout=30) as response:
-                if response.status == 200:
-                    return json.loads(response.read().decode('utf-8'))
+        Tokens are normally renewed in the background by maybe_refresh_tokens();
+        a 401 here triggers a one-shot inline refresh and a single retry.
+        """
+        try:
+            try:
+                return self._request_usage(access_token, account_id)
+            except urllib.error.HTTPError as e:
+                if e.code != 401:
+                    raise
+                print("Codex API unauthorized, refreshing token and retrying")
+                creds = self._load_credentials()
+                # Hand over the token that failed, not the one on disk: if a
+                # concurrent refresh already replaced it, that token is reused
+                refreshed = self._refresh_token({**creds, "access_token": access_token}) if creds else None
+                if not refreshed:
+                    raise
+                return self._request_usage(refreshed["access_token"], refreshed.get("account_id"))
 
         except urllib.error.HTTPError as e:
             if e.code in (401, 403):
@@ -567,8 +1042,19 @@ class CodexOAuthFetcher:
 
         return None
 
-    def collect(self) -> ProviderStats:
-        """Collect Codex usage from OAuth API"""
+    def collect(self, force: bool = False) -> ProviderStats:
+        """Collect Codex usage from OAuth API.
+
+        A usage response served from the TTL cache or revalidated with a 304
+        is the same payload object as last time; the previous parse is then
+        reused and only the timestamps and the time-dependent pace change.
+        """
+        # Serialize collects so the response cache and session index are
+        # never updated from two worker threads at once
+        with self._collect_lock:
+            return self._collect(force)
+
+    def _collect(self, force: bool) -> ProviderStats:
         stats = ProviderStats(
             provider_id="codex",
             provider_name="Codex",
@@ -585,15 +1071,8 @@ class CodexOAuthFetcher:
             stats.error_message = "No access token found. Run 'codex' to authenticate."
             return stats
 
-        # Refresh token if needed
-        if self._needs_refresh(creds):
-            refreshed = self._refresh_token(creds)
-            if refreshed:
-                creds = refreshed
-                access_token = creds["access_token"]
-
         # Fetch usage data
-        usage_data = self._fetch_usage_api(access_token, creds.get("account_id"))
+        usage_data = self._fetch_usage_api(access_token, creds.get("account_id"), force=force)
         if not usage_data:
             stats.error_message = "Failed to fetch usage data from API."
             stats.is_connected = True  # We have credentials, just API failed
@@ -601,7 +1080,33 @@ class CodexOAuthFetcher:
 
         stats.is_connected = True
         stats.last_update = datetime.now()
+        stats.last_update_monotonic = time.monotonic()
+
+        # A cached or revalidated response is the very same payload object
+        last = self._last_stats
+        if last is not None and last[0] is usage_data:
+            stats = replace(last[1], last_update=stats.last_update,
+                            last_update_monotonic=stats.last_update_monotonic)
+        else:
+            self._parse_usage(stats, usage_data)
+            self._last_stats = (usage_data, stats)
+
+        # Calculate pace for secondary window; it moves with the clock
+        if stats.weekly_reset_time and stats.weekly_used_pct > 0:
+            # Assume 7-day window if we have secondary window data
+            secondary = usage_data.get("rate_limit", {}).get("secondary_window", {})
+            secondary_window_seconds = secondary.get("limit_window_seconds", 7 * 24 * 3600)
+            _set_pace(stats, timedelta(seconds=secondary_window_seconds), datetime.now(timezone.utc))
 
+        # Load token stats from local session files
+        local_stats = self._load_local_cost_stats()
+        stats.cost_today_tokens = local_stats["cost_today_tokens"]
+        stats.cost_30_days_tokens = local_stats["cost_30_days_tokens"]
+
+        return stats
+
+    def _parse_usage(self, stats: ProviderStats, usage_data: dict):
+        """Fill stats from a usage API payload"""
         # Parse plan type
         plan_type = usage_data.get("plan_type", "unknown")
         stats.plan_name = self.PLAN_DISPLAY_NAMES.get(plan_type, plan_type.replace("_", " ").title())
@@ -648,37 +1153,20 @@ class CodexOAuthFetcher:
                 except:
                     stats.extra_usage_current = 0
 
-        # Calculate pace for secondary window
-        if stats.weekly_reset_time and stats.weekly_used_pct > 0:
-            now = datetime.now(timezone.utc)
-            # Assume 7-day window if we have secondary window data
-            secondary_window_seconds = secondary.get("limit_window_seconds", 7 * 24 * 3600)
-            window_duration = timedelta(seconds=secondary_window_seconds)
-            window_start = stats.weekly_reset_time - window_duration
-            total_seconds = window_duration.total_seconds()
-            elapsed_seconds = (now - window_start).total_seconds()
-            expected_pct = (elapsed_seconds / total_seconds) * 100
-
-            stats.pace_percentage = stats.weekly_used_pct - expected_pct
-            if stats.pace_percentage < 0:
-                stats.pace_status = f"Behind ({stats.pace_percentage:.0f}%)"
-            elif stats.pace_percentage > 0:
-                stats.pace_status = f"Ahead (+{stats.pace_percentage:.0f}%)"
-            else:
-                stats.pace_status = "On track"
-
-        # Load token stats from local session files
-        local_stats = self._load_local_cost_stats()
-        stats.cost_today_tokens = local_stats["cost_today_tokens"]
-        stats.cost_30_days_tokens = local_stats["cost_30_days_tokens"]
-
-        return stats
-
     def _load_local_cost_stats(self) -> dict:
         """Load token stats from Codex CLI session files.
 
         Session files at ~/.codex/sessions/YYYY/MM/DD/*.jsonl contain
         token_count events with cumulative total_token_usage per session.
+        Per-session totals are kept in a persistent index so only new or
+        modified session files are parsed.
+
+        Day directories are walked from today backwards. Once a day holds
+        nothing newer than the newest mtime already indexed, older days are
+        assumed unchanged and the walk stops, so a steady-state tick scans
+        only today's directory. Sessions modified within the last day are
+        still re-checked by path (long sessions keep writing to the day they
+        started in), and the first tick of each day walks all 30 days.
         """
         result = {
             "cost_today": 0.0,
@@ -690,213 +1178,490 @@ class CodexOAuthFetcher:
         if not self.sessions_dir.exists():
             return result
 
+        index = self._load_session_index()
+        dirty = False
+
         try:
             today = datetime.now().date()
             thirty_days_ago = today - timedelta(days=30)
-
-            for year_dir in sorted(self.sessions_dir.iterdir()):
-                if not year_dir.is_dir() or not year_dir.name.isdigit():
-                    continue
-                for month_dir in sorted(year_dir.iterdir()):
-                    if not month_dir.is_dir() or not month_dir.name.isdigit():
+            today_ymd = today.year * 10000 + today.month * 100 + today.day
+            cutoff_ymd = thirty_days_ago.year * 10000 + thirty_days_ago.month * 100 + thirty_days_ago.day
+            full_scan = self._session_full_scan_ymd != today_ymd
+            max_mtime_ns = self._session_max_mtime_ns
+            walked = set()
+            seen = set()
+
+            for days_ago in range(31):
+                day = today - timedelta(days=days_ago)
+                dir_ymd = day.year * 10000 + day.month * 100 + day.day
+                walked.add(dir_ymd)
+                has_newer = False
+                for path, st in self._iter_day_sessions(day):
+                    seen.add(path)
+                    if st.st_mtime_ns > max_mtime_ns:
+                        has_newer = True
+                        self._session_max_mtime_ns = max(self._session_max_mtime_ns, st.st_mtime_ns)
+                    entry = index.get(path)
+                    if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                        index[path] = [st.st_mtime_ns, st.st_size, self._get_session_tokens(path), dir_ymd]
+                        dirty = True
+                if not full_scan and not has_newer:
+                    break
+
+            active_since = time.time_ns() - SESSION_ACTIVE_WINDOW_NS
+            for path, entry in list(index.items()):
+                if entry[3] in walked:
+                    if path in seen:
+                        continue
+                elif entry[3] >= cutoff_ymd:
+                    if entry[0] < active_since:
+                        continue  # Older day not walked this tick: keep as indexed
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        pass
+                    else:
+                        if entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                            index[path] = [st.st_mtime_ns, st.st_size, self._get_session_tokens(path), entry[3]]
+                            self._session_max_mtime_ns = max(self._session_max_mtime_ns, st.st_mtime_ns)
+                            dirty = True
                         continue
-                    for day_dir in sorted(month_dir.iterdir()):
-                        if not day_dir.is_dir() or not day_dir.name.isdigit():
-                            continue
-
-                        try:
-                            dir_date = datetime(
-                                int(year_dir.name),
-                                int(month_dir.name),
-                                int(day_dir.name)
-                            ).date()
-                        except ValueError:
-                            continue
-
-                        if dir_date < thirty_days_ago:
-                            continue
-
-                        for session_file in day_dir.glob("*.jsonl"):
-                            tokens = self._get_session_tokens(session_file)
-                            if dir_date == today:
-                                result["cost_today_tokens"] += tokens
-                            result["cost_30_days_tokens"] += tokens
+                # Deleted, or aged out of the window
+                del index[path]
+                dirty = True
+
+            if full_scan:
+                self._session_full_scan_ymd = today_ymd
+                dirty = True
+
+            result["cost_today_tokens"] = sum(e[2] for e in index.values() if e[3] == today_ymd)
+            result["cost_30_days_tokens"] = sum(e[2] for e in index.values())
         except Exception:
             pass
 
+        if dirty:
+            self._save_session_index(index)
+
         return result
 
+    def _iter_day_sessions(self, day):
+        """Yield (path, stat) for the session files in one sessions/YYYY/MM/DD directory"""
+        day_dir = os.path.join(self.sessions_dir, f"{day.year:04d}", f"{day.month:02d}", f"{day.day:02d}")
+        try:
+            with os.scandir(day_dir) as files:
+                for f in files:
+                    if not f.name.endswith(".jsonl"):
+                        continue
+                    try:
+                        yield f.path, f.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+    def _load_session_index(self) -> Dict[str, list]:
+        """Load the session index: path -> [mtime_ns, size, output_tokens, yyyymmdd]"""
+        if self._session_index is None:
+            self._session_index = {}
+            try:
+                with open(self.session_index_file, 'rb') as f:
+                    data = _loads(f.read())
+                if data.get("version") == SESSION_INDEX_VERSION:
+                    self._session_index = data.get("sessions", {})
+                    self._session_max_mtime_ns = data.get("max_mtime_ns", 0)
+                    self._session_full_scan_ymd = data.get("full_scan_ymd", 0)
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._session_index
+
+    def _save_session_index(self, index: Dict[str, list]):
+        """Persist the session index atomically"""
+        tmp = self.session_index_file.with_suffix(".json.tmp")
+        try:
+            self.session_index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump({
+                    "version": SESSION_INDEX_VERSION,
+                    "max_mtime_ns": self._session_max_mtime_ns,
+                    "full_scan_ymd": self._session_full_scan_ymd,
+                    "sessions": index,
+                }, f)
+            os.replace(tmp, self.session_index_file)
+        except OSError as e:
+            print(f"Error saving Codex session index: {e}")
+
     def _get_session_tokens(self, session_file) -> int:
         """Extract output tokens from the last token_count event in a session file.
 
         Uses output_tokens only to match Claude's metric (model-generated tokens).
+        The file is read backwards in binary so only its tail is parsed.
         """
         last_output = 0
         try:
-            with open(session_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line)
-                        payload = entry.get("payload") or {}
-                        if (entry.get("type") == "event_msg"
-                                and payload.get("type") == "token_count"):
-                            info = payload.get("info") or {}
-                            usage = info.get("total_token_usage") or {}
-                            last_output = usage.get("output_tokens", 0)
-                    except (json.JSONDecodeError, KeyError, TypeError):
-                        continue
-        except Exception:
+            for line in _iter_lines_reversed(session_file):
+                # Cheap byte-level pre-filter: a token_count event must contain
+                # this literal, so most lines never reach the JSON decoder.
+                if b'"token_count"' not in line:
+                    continue
+                try:
+                    entry = _loads(line)
+                    payload = entry.get("payload") or {}
+                    if (entry.get("type") == "event_msg"
+                            and payload.get("type") == "token_count"):
+                        info = payload.get("info") or {}
+                        usage = info.get("total_token_usage") or {}
+                        last_output = usage.get("output_tokens", 0)
+                        break
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+        except OSError:
             pass
         return last_output
 
 
+def _iter_lines_reversed(path, chunk_size: int = 65536):
+    """Yield the non-empty lines of a file from last to first, as bytes.
+
+    Reads backwards in fixed-size chunks (like tail), so callers looking for
+    the most recent matching record only touch the end of the file.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        remainder = b""
+        while pos > 0:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            os.lseek(fd, pos, os.SEEK_SET)
+            lines = (os.read(fd, read_size) + remainder).split(b"\n")
+            # The first piece may be the tail of a line started in the
+            # previous chunk; keep it until that chunk has been read.
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if remainder:
+            yield remainder
+    finally:
+        os.close(fd)
+
+
+# Worker threads shared by collect_all() and the tray app's background refreshes
+collect_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ai-monitor")
+
+
+def collect_all(collectors: Dict[str, Any], force: bool = False) -> Dict[str, ProviderStats]:
+    """Collect stats from every provider concurrently.
+
+    Each collector spends most of its time blocked on its own HTTPS
+    round-trip, so running them side by side makes a refresh take as long
+    as the slowest provider instead of the sum of all of them. Pass
+    force=True to bypass the usage response cache.
+    """
+    if not collectors:
+        return {}
+    futures = {pid: collect_pool.submit(c.collect, force) for pid, c in collectors.items()}
+    return {pid: future.result() for pid, future in futures.items()}
+
+
 # ============================================================================
 # Icon Generator
 # ============================================================================
 
 # Path to bundled SVG icons
-APP_ICON_SVG = Path(__file__).parent / "icons" / "app-icon.svg"
-TRAY_ICON_SVG = Path(__file__).parent / "icons" / "tray-icon.svg"
+BUNDLED_ICON_DIR = Path(__file__).parent / "icons"
+APP_ICON_SVG = BUNDLED_ICON_DIR / "app-icon.svg"
+TRAY_ICON_SVG = BUNDLED_ICON_DIR / "tray-icon.svg"
+# Bundled assets do not come and go while the app runs
+_APP_SVG_EXISTS = APP_ICON_SVG.exists()
+_TRAY_SVG_EXISTS = TRAY_ICON_SVG.exists()
+
+
+# Sizes app icons are rendered at; other requests round up to one of these
+ICON_SIZE_BUCKETS = (16, 22, 24, 32, 48, 64, 96, 128, 256)
+
+# Deflate level for generated PNGs; the icons are tiny, so the default
+# level buys almost nothing over the fastest one
+PNG_COMPRESSION_LEVEL = 1
+
+
+def _write_surface_png(surface, icon_path: str):
+    """Write a Cairo surface as PNG with a single write() call.
+
+    Encoding stays in cairo's C writer; the file is assembled in memory
+    first so the OS sees one write instead of libpng's many small ones.
+    """
+    buf = io.BytesIO()
+    surface.write_to_png(buf)
+    Path(icon_path).write_bytes(buf.getvalue())
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_icon_dir():
+    """Create ICON_DIR once per process, however many generators are made"""
+    ICON_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _icon_is_current(icon_path: str, source: Path) -> bool:
+    """Check whether a generated icon exists and is not older than its source"""
+    try:
+        return os.stat(icon_path).st_mtime_ns >= source.stat().st_mtime_ns
+    except OSError:
+        return False
+
+
+# An Rsvg.Handle must not be rendered from two threads at once
+_svg_render_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_svg_bytes(svg_path: str) -> bytes:
+    """Read a bundled SVG from disk once; later renders work from memory"""
+    with open(svg_path, 'rb') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_svg_handle(svg_path: str):
+    """Parse an SVG once; the handle is reused for every size rendered from it"""
+    return Rsvg.Handle.new_from_data(_read_svg_bytes(svg_path))
 
 
 class IconGenerator:
     """Generates modern application icons for AI Usage Monitor"""
 
+    # Idle render surfaces by size; a surface is popped while in use, so two
+    # threads never draw on the same one
+    _surface_pool: Dict[int, "cairo.ImageSurface"] = {}
+    # Rendered icon paths by size. Both icons are a pure function of the size
+    # for the life of the process, so each size is rendered at most once,
+    # whichever instance asks.
+    _app_icon_paths: Dict[int, str] = {}
+    _tray_icon_paths: Dict[int, str] = {}
+
     def __init__(self):
-        ICON_DIR.mkdir(parents=True, exist_ok=True)
+        _ensure_icon_dir()
 
-    def _rounded_rect(self, ctx, x, y, width, height, radius):
-        """Draw a rounded rectangle path"""
-        ctx.new_path()
-        ctx.arc(x + radius, y + radius, radius, math.pi, 1.5 * math.pi)
-        ctx.arc(x + width - radius, y + radius, radius, 1.5 * math.pi, 2 * math.pi)
-        ctx.arc(x + width - radius, y + height - radius, radius, 0, 0.5 * math.pi)
-        ctx.arc(x + radius, y + height - radius, radius, 0.5 * math.pi, math.pi)
+    def _acquire_surface(self, size: int) -> "cairo.ImageSurface":
+        """Take a cleared size x size surface from the pool, or allocate one"""
+        surface = self._surface_pool.pop(size, None)
+        if surface is None:
+            return cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+        ctx = cairo.Context(surface)
+        ctx.set_operator(cairo.OPERATOR_CLEAR)
+        ctx.paint()
+        return surface
+
+    def _release_surface(self, size: int, surface: "cairo.ImageSurface"):
+        self._surface_pool[size] = surface
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _rounded_rect_path(width, height, radius):
+        """Build a rounded rectangle path at the origin once per shape"""
+        ctx = cairo.Context(cairo.RecordingSurface(cairo.CONTENT_ALPHA, None))
+        ctx.arc(radius, radius, radius, math.pi, 1.5 * math.pi)
+        ctx.arc(width - radius, radius, radius, 1.5 * math.pi, 2 * math.pi)
+        ctx.arc(width - radius, height - radius, radius, 0, 0.5 * math.pi)
+        ctx.arc(radius, height - radius, radius, 0.5 * math.pi, math.pi)
         ctx.close_path()
+        return ctx.copy_path()
+
+    def _rounded_rect(self, ctx, x, y, width, height, radius):
+        """Add a rounded rectangle to the current path"""
+        ctx.save()
+        ctx.translate(x, y)
+        ctx.append_path(self._rounded_rect_path(width, height, radius))
+        ctx.restore()
+
+    def _rasterize_svg(self, svg_path: Path, size: int, icon_path: str):
+        """Render an SVG to a size x size PNG at icon_path"""
+        if not HAS_RSVG:
+            stream = Gio.MemoryInputStream.new_from_bytes(
+                GLib.Bytes.new(_read_svg_bytes(str(svg_path)))
+            )
+            pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(stream, size, size, True, None)
+            _, png = pixbuf.save_to_bufferv("png", ["compression"], [str(PNG_COMPRESSION_LEVEL)])
+            Path(icon_path).write_bytes(png)
+            return
+
+        handle = _load_svg_handle(str(svg_path))
+        dims = handle.get_dimensions()
+        surface = self._acquire_surface(size)
+        try:
+            ctx = cairo.Context(surface)
+            scale = size / max(dims.width, dims.height)
+            ctx.scale(scale, scale)
+            with _svg_render_lock:
+                handle.render_cairo(ctx)
+            _write_surface_png(surface, icon_path)
+        finally:
+            self._release_surface(size, surface)
 
     def create_app_icon(self, size: int = 64) -> str:
-        """Create modern app icon - uses bundled SVG or generates PNG fallback"""
+        """Create modern app icon - uses bundled SVG or generates PNG fallback.
+
+        The size is rounded up to the nearest of ICON_SIZE_BUCKETS so nearby
+        sizes share one rendered file; GTK scales it down as needed.
+        """
+        bucket = next((b for b in ICON_SIZE_BUCKETS if b >= size), size)
+        icon_path = self._app_icon_paths.get(bucket)
+        if icon_path is None:
+            icon_path = self._app_icon_paths[bucket] = self._create_app_icon(bucket)
+        return icon_path
+
+    def _create_app_icon(self, size: int) -> str:
+        # Common sizes ship pre-rendered next to the SVG
+        bundled = BUNDLED_ICON_DIR / f"app-icon-{size}.png"
+        if bundled.exists():
+            return str(bundled)
+
+        icon_path = str(ICON_DIR / f"app-icon-{size}.png")
+
         # Try to use the bundled SVG icon first
-        if APP_ICON_SVG.exists():
+        if _APP_SVG_EXISTS:
+            # Reuse the PNG rendered by an earlier run
+            if _icon_is_current(icon_path, APP_ICON_SVG):
+                return icon_path
             try:
-                # Convert SVG to PNG at requested size using GdkPixbuf
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(APP_ICON_SVG), size, size, True
-                )
-                icon_path = str(ICON_DIR / f"app-icon-{size}.png")
-                pixbuf.savev(icon_path, "png", [], [])
+                self._rasterize_svg(APP_ICON_SVG, size, icon_path)
                 return icon_path
             except Exception as e:
-                print(f"Could not load SVG icon: {e}")
+                logger.warning("Could not load SVG icon: %s", e)
 
         # Fallback: Generate PNG with Cairo
         return self._generate_app_icon_cairo(size)
 
+    def create_app_icons(self, sizes) -> List[str]:
+        """Create app icons for several sizes, rendering them in parallel"""
+        sizes = list(sizes)
+        if not sizes:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(sizes), os.cpu_count() or 1)) as pool:
+            return list(pool.map(self.create_app_icon, sizes))
+
     def _generate_app_icon_cairo(self, size: int = 64) -> str:
         """Generate KDE-style monochrome app icon using Cairo (fallback) - Robot face"""
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
-        ctx = cairo.Context(surface)
+        icon_path = str(ICON_DIR / f"app-icon-{size}.png")
+        surface = self._acquire_surface(size)
+        try:
+            self._draw_app_icon(cairo.Context(surface), size)
+            _write_surface_png(surface, icon_path)
+        finally:
+            self._release_surface(size, surface)
+        return icon_path
 
+    def _draw_app_icon(self, ctx, size: int):
+        """Draw the monochrome robot face app icon"""
         ctx.set_source_rgba(1, 1, 1, 0.95)
-        line_width = size * 0.06
-
-        # Antenna
-        ctx.set_line_width(line_width)
+        ctx.set_line_width(size * 0.06)
         ctx.set_line_cap(cairo.LINE_CAP_ROUND)
+
+        # Outlines: antenna, head (rounded rectangle) and mouth in one stroke
         ctx.move_to(size / 2, size * 0.03)
         ctx.line_to(size / 2, size * 0.19)
-        ctx.stroke()
-        ctx.arc(size / 2, size * 0.03, size * 0.045, 0, 2 * math.pi)
-        ctx.fill()
-
-        # Head (rounded rectangle)
         head_x, head_y = size * 0.125, size * 0.22
         head_w, head_h = size * 0.75, size * 0.69
         head_r = size * 0.16
         self._rounded_rect(ctx, head_x, head_y, head_w, head_h, head_r)
-        ctx.set_line_width(line_width)
+        ctx.move_to(size * 0.31, size * 0.72)
+        ctx.line_to(size * 0.69, size * 0.72)
         ctx.stroke()
 
-        # Eyes
+        # Solid shapes: antenna tip and eyes in one fill
+        ctx.arc(size / 2, size * 0.03, size * 0.045, 0, 2 * math.pi)
+        ctx.close_path()
         eye_w, eye_h = size * 0.19, size * 0.16
         eye_r = size * 0.05
         self._rounded_rect(ctx, size * 0.23, size * 0.375, eye_w, eye_h, eye_r)
-        ctx.fill()
         self._rounded_rect(ctx, size * 0.58, size * 0.375, eye_w, eye_h, eye_r)
         ctx.fill()
 
-        # Mouth
-        ctx.set_line_width(line_width)
-        ctx.set_line_cap(cairo.LINE_CAP_ROUND)
-        ctx.move_to(size * 0.31, size * 0.72)
-        ctx.line_to(size * 0.69, size * 0.72)
-        ctx.stroke()
-
-        icon_path = str(ICON_DIR / f"app-icon-{size}.png")
-        surface.write_to_png(icon_path)
-        return icon_path
-
     def create_tray_icon(self, size: int = 22) -> str:
         """Create static KDE-style monochrome tray icon - Robot face"""
-        icon_path = str(ICON_DIR / "tray-robot.png")
+        icon_path = self._tray_icon_paths.get(size)
+        if icon_path is None:
+            icon_path = self._tray_icon_paths[size] = self._create_tray_icon(size)
+        return icon_path
 
-        # Try to use bundled SVG first
-        if TRAY_ICON_SVG.exists():
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(TRAY_ICON_SVG), size, size, True
-                )
-                pixbuf.savev(icon_path, "png", [], [])
-                print(f"Loaded tray icon from SVG: {TRAY_ICON_SVG}")
-                return icon_path
-            except Exception as e:
-                print(f"Failed to load SVG tray icon: {e}")
+    def _create_tray_icon(self, size: int) -> str:
+        # Both AppIndicator and Gtk.StatusIcon load SVG files themselves and
+        # render them at the panel's size, so the bundled SVG needs no PNG
+        if _TRAY_SVG_EXISTS:
+            logger.debug("Using tray icon SVG: %s", TRAY_ICON_SVG)
+            return str(TRAY_ICON_SVG)
+
+        icon_path = str(ICON_DIR / f"tray-robot-{size}.png")
 
         # Fallback: Generate with Cairo - Robot face
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
-        ctx = cairo.Context(surface)
+        surface = self._acquire_surface(size)
+        try:
+            self._draw_tray_icon(cairo.Context(surface), size)
+            _write_surface_png(surface, icon_path)
+        finally:
+            self._release_surface(size, surface)
+        return icon_path
 
-        ctx.set_source_rgba(1, 1, 1, 0.95)
-        line_width = size * 0.07
+    def create_tray_pixbuf(self, size: int = 22) -> GdkPixbuf.Pixbuf:
+        """Tray icon as an in-memory pixbuf, for APIs that accept one.
 
-        # Antenna
-        ctx.set_line_width(line_width)
+        Renders the bundled SVG from its cached bytes, or draws the Cairo
+        robot face, without writing or reading any file in ICON_DIR.
+        """
+        if _TRAY_SVG_EXISTS:
+            stream = Gio.MemoryInputStream.new_from_bytes(
+                GLib.Bytes.new(_read_svg_bytes(str(TRAY_ICON_SVG)))
+            )
+            return GdkPixbuf.Pixbuf.new_from_stream_at_scale(stream, size, size, True, None)
+
+        surface = self._acquire_surface(size)
+        try:
+            self._draw_tray_icon(cairo.Context(surface), size)
+            # pixbuf_get_from_surface copies the pixels, so the surface can go back to the pool
+            return Gdk.pixbuf_get_from_surface(surface, 0, 0, size, size)
+        finally:
+            self._release_surface(size, surface)
+
+    def _draw_tray_icon(self, ctx, size: int):
+        """Draw the monochrome robot face tray icon"""
+        ctx.set_source_rgba(1, 1, 1, 0.95)
+        ctx.set_line_width(size * 0.07)
         ctx.set_line_cap(cairo.LINE_CAP_ROUND)
+
+        # Outlines: antenna, head and mouth in one stroke
         ctx.move_to(size / 2, size * 0.045)
         ctx.line_to(size / 2, size * 0.18)
-        ctx.stroke()
-        ctx.arc(size / 2, size * 0.045, size * 0.045, 0, 2 * math.pi)
-        ctx.fill()
-
-        # Head
         head_x, head_y = size * 0.14, size * 0.23
         head_w, head_h = size * 0.72, size * 0.64
         head_r = size * 0.14
         self._rounded_rect(ctx, head_x, head_y, head_w, head_h, head_r)
-        ctx.set_line_width(line_width)
+        ctx.move_to(size * 0.32, size * 0.68)
+        ctx.line_to(size * 0.68, size * 0.68)
         ctx.stroke()
 
-        # Eyes
+        # Solid shapes: antenna tip and eyes in one fill
+        ctx.arc(size / 2, size * 0.045, size * 0.045, 0, 2 * math.pi)
+        ctx.close_path()
         eye_w, eye_h = size * 0.18, size * 0.14
         eye_r = size * 0.045
         self._rounded_rect(ctx, size * 0.25, size * 0.36, eye_w, eye_h, eye_r)
-        ctx.fill()
         self._rounded_rect(ctx, size * 0.57, size * 0.36, eye_w, eye_h, eye_r)
         ctx.fill()
 
-        # Mouth
-        ctx.move_to(size * 0.32, size * 0.68)
-        ctx.line_to(size * 0.68, size * 0.68)
-        ctx.stroke()
-
-        surface.write_to_png(icon_path)
-        return icon_path
-
 
 # ============================================================================
 # Theme System
 # ============================================================================
 
+_INV255 = tuple(i / 255 for i in range(256))
+
+
+def _parse_color(color_str: str) -> tuple:
+    """Parse hex color to RGB tuple"""
+    r, g, b = bytes.fromhex(color_str.lstrip('#')[:6])
+    return (_INV255[r], _INV255[g], _INV255[b])
+
+
 class Theme:
     """Color theme for the UI"""
 
@@ -944,10 +1709,18 @@ class Theme:
         "tab_inactive_fg": "#808080",
     }
 
+    # Hex colors pre-parsed to (r, g, b) floats for Cairo drawing
+    LIGHT_RGB = {k: _parse_color(v) for k, v in LIGHT.items() if v.startswith("#")}
+    DARK_RGB = {k: _parse_color(v) for k, v in DARK.items() if v.startswith("#")}
+
     @classmethod
     def get(cls, theme_name: str) -> dict:
         return cls.DARK if theme_name == "dark" else cls.LIGHT
 
+    @classmethod
+    def get_rgb(cls, theme_name: str) -> dict:
+        return cls.DARK_RGB if theme_name == "dark" else cls.LIGHT_RGB
+
 
 class ThemeManager:
     """Manages theme preferences"""
@@ -955,24 +1728,40 @@ class ThemeManager:
     def __init__(self):
         self.config_file = CONFIG_DIR / "settings.json"
         self._theme = "dark"  # Default to dark
+        self._dir_ready = False
         self._load()
 
     def _load(self):
+        # The file is a few bytes; one open + read, no exists() round-trip
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    self._theme = data.get("theme", "dark")
-        except:
-            pass
+            fd = os.open(self.config_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return  # First run, keep the default
+        except OSError as e:
+            logger.debug("Could not open %s: %s", self.config_file, e)
+            return
+        try:
+            data = _loads(os.read(fd, 4096))
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable %s: %s", self.config_file, e)
+            return
+        finally:
+            os.close(fd)
+        if isinstance(data, dict):
+            self._theme = data.get("theme", "dark")
 
     def save(self):
+        """Write the settings atomically (temp file + os.replace)"""
         try:
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
+            if not self._dir_ready:
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+            tmp = self.config_file.with_suffix(".json.tmp")
+            with open(tmp, 'w') as f:
                 json.dump({"theme": self._theme}, f)
-        except:
-            pass
+            os.replace(tmp, self.config_file)
+        except OSError as e:
+            print(f"Error saving settings: {e}")
 
     @property
     def theme(self) -> str:
@@ -980,6 +1769,8 @@ class ThemeManager:
 
     @theme.setter
     def theme(self, value: str):
+        if value == self._theme:
+            return
         self._theme = value
         self.save()
 
@@ -987,11 +1778,29 @@ class ThemeManager:
     def colors(self) -> dict:
         return Theme.get(self._theme)
 
+    @property
+    def rgb(self) -> dict:
+        return Theme.get_rgb(self._theme)
+
 
 # Global theme manager
 theme_manager = ThemeManager()
 
 
+_ALIGN_START = Gtk.Align.START
+
+
+def _mklabel(text: str = "", css_class: Optional[str] = None,
+             halign: Optional[Gtk.Align] = _ALIGN_START) -> Gtk.Label:
+    """Create a label with an optional style class and horizontal alignment"""
+    label = Gtk.Label(label=text)
+    if css_class:
+        label.get_style_context().add_class(css_class)
+    if halign is not None:
+        label.set_halign(halign)
+    return label
+
+
 class SettingsDialog(Gtk.Dialog):
     """Settings dialog for theme selection"""
 
@@ -1012,9 +1821,7 @@ class SettingsDialog(Gtk.Dialog):
         content.set_margin_end(20)
 
         # Theme section
-        theme_label = Gtk.Label(label="Theme")
-        theme_label.set_halign(Gtk.Align.START)
-        theme_label.get_style_context().add_class("settings-label")
+        theme_label = _mklabel("Theme", "settings-label")
         content.pack_start(theme_label, False, False, 0)
 
         theme_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
@@ -1041,9 +1848,179 @@ class SettingsDialog(Gtk.Dialog):
         return "dark" if self.dark_btn.get_active() else "light"
 
 
+# Window stylesheet; $names are keys of the Theme color dicts
+_CSS_TEMPLATE = string.Template("""
+    * {
+        font-family: "Noto Sans", "Segoe UI", "Ubuntu", sans-serif;
+    }
+
+    .main-window {
+        background-color: transparent;
+    }
+
+    .tab-bar {
+        padding: 10px 12px 6px 12px;
+    }
+
+    .tab-button {
+        background: transparent;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 14px;
+        margin: 0 3px;
+        color: $fg_secondary;
+        font-size: 11px;
+        font-weight: 500;
+    }
+    .tab-button:hover {
+        background-color: $bg_hover;
+        color: $fg;
+    }
+    .tab-button.active {
+        background-color: $tab_active_bg;
+        color: $tab_active_fg;
+    }
+
+    .content-area {
+        padding: 12px 18px;
+    }
+
+    .provider-header {
+        font-size: 20px;
+        font-weight: 600;
+        color: $fg;
+    }
+    .update-time {
+        font-size: 12px;
+        color: $fg_muted;
+    }
+    .plan-badge {
+        font-size: 12px;
+        color: $fg_secondary;
+        font-weight: 500;
+        background-color: $bg_secondary;
+        padding: 4px 10px;
+        border-radius: 12px;
+    }
+
+    .section-title {
+        font-size: 13px;
+        font-weight: 600;
+        color: $fg;
+        margin-top: 14px;
+    }
+
+    .stat-label {
+        font-size: 12px;
+        color: $fg_muted;
+    }
+    .stat-value {
+        font-size: 12px;
+        color: $fg_secondary;
+        font-weight: 500;
+    }
+
+    .pace-text {
+        font-size: 11px;
+        color: $fg_muted;
+        margin-top: 2px;
+    }
+
+    .separator {
+        background-color: $border;
+        min-height: 1px;
+        margin: 14px 0;
+    }
+
+    .cost-title {
+        font-size: 13px;
+        font-weight: 600;
+        color: $fg;
+    }
+    .cost-detail {
+        font-size: 12px;
+        color: $fg_secondary;
+        margin: 3px 0;
+    }
+
+    .menu-item {
+        padding: 10px 6px;
+        border-radius: 8px;
+        background: transparent;
+        border: none;
+    }
+    .menu-item:hover {
+        background-color: $bg_hover;
+    }
+    .menu-item-text {
+        font-size: 13px;
+        color: $fg;
+    }
+
+    .menu-separator {
+        background-color: $border;
+        min-height: 1px;
+        margin: 10px 0;
+    }
+
+    .footer-item {
+        padding: 8px 6px;
+        background: transparent;
+        border: none;
+        border-radius: 6px;
+    }
+    .footer-item:hover {
+        background-color: $bg_hover;
+    }
+    .footer-text {
+        font-size: 12px;
+        color: $fg_muted;
+    }
+
+    progressbar trough {
+        background-color: $progress_bg;
+        border-radius: 3px;
+        min-height: 6px;
+    }
+    progressbar progress {
+        border-radius: 3px;
+        min-height: 6px;
+        background-color: $progress_green;
+    }
+    progressbar.warning progress {
+        background-color: $progress_yellow;
+    }
+    progressbar.error progress {
+        background-color: $progress_red;
+    }
+
+    .error-text {
+        color: $fg_muted;
+        font-size: 13px;
+    }
+
+    .settings-dialog {
+        background-color: $bg;
+    }
+    .settings-label {
+        font-size: 13px;
+        font-weight: 500;
+        color: $fg;
+    }
+    """)
+
+
 class AIUsageMonitorWindow(Gtk.Window):
     """Main application window with tabbed interface and theme support"""
 
+    # Encoded stylesheet per theme name; the themes never change at runtime
+    _CSS_CACHE: Dict[str, bytes] = {}
+    # One parsed provider per theme, created when a window first needs it
+    # (not at import, so the CLI never needs a display); only the provider
+    # of _applied_theme is attached to the screen
+    _style_providers: Dict[str, Gtk.CssProvider] = {}
+    _applied_theme: Optional[str] = None
+
     def __init__(self, providers: Dict[str, ProviderStats], on_refresh: callable, on_quit: callable,
                  on_theme_changed: callable = None):
         super().__init__(title=APP_NAME)
@@ -1052,6 +2029,9 @@ class AIUsageMonitorWindow(Gtk.Window):
         self.on_quit = on_quit
         self.on_theme_changed = on_theme_changed
         self.current_provider = "claude"
+        self._destroy_pending = False
+        # Window outline path by allocated (width, height)
+        self._path_cache: Dict[Tuple[int, int], Any] = {}
 
         self.set_default_size(360, 580)
         self.set_type_hint(Gdk.WindowTypeHint.POPUP_MENU)
@@ -1077,226 +2057,90 @@ class AIUsageMonitorWindow(Gtk.Window):
 
     def _on_focus_out(self, widget, event):
         """Hide and destroy window on focus loss"""
+        self._dismiss()
+        return False
+
+    def _dismiss(self):
+        """Hide now; tear the widget tree down once the main loop is idle"""
         self.hide()
+        if not self._destroy_pending:
+            self._destroy_pending = True
+            GLib.idle_add(self._destroy_idle)
+
+    def _destroy_idle(self) -> bool:
         self.destroy()
         return False
 
     def _get_css(self) -> bytes:
         """Generate CSS based on current theme"""
-        c = theme_manager.colors
-        return f"""
-        * {{
-            font-family: "Noto Sans", "Segoe UI", "Ubuntu", sans-serif;
-        }}
-
-        .main-window {{
-            background-color: transparent;
-        }}
-
-        .tab-bar {{
-            padding: 10px 12px 6px 12px;
-        }}
-
-        .tab-button {{
-            background: transparent;
-            border: none;
-            border-radius: 8px;
-            padding: 8px 14px;
-            margin: 0 3px;
-            color: {c["fg_secondary"]};
-            font-size: 11px;
-            font-weight: 500;
-        }}
-        .tab-button:hover {{
-            background-color: {c["bg_hover"]};
-            color: {c["fg"]};
-        }}
-        .tab-button.active {{
-            background-color: {c["tab_active_bg"]};
-            color: {c["tab_active_fg"]};
-        }}
-
-        .content-area {{
-            padding: 12px 18px;
-        }}
-
-        .provider-header {{
-            font-size: 20px;
-            font-weight: 600;
-            color: {c["fg"]};
-        }}
-        .update-time {{
-            font-size: 12px;
-            color: {c["fg_muted"]};
-        }}
-        .plan-badge {{
-            font-size: 12px;
-            color: {c["fg_secondary"]};
-            font-weight: 500;
-            background-color: {c["bg_secondary"]};
-            padding: 4px 10px;
-            border-radius: 12px;
-        }}
-
-        .section-title {{
-            font-size: 13px;
-            font-weight: 600;
-            color: {c["fg"]};
-            margin-top: 14px;
-        }}
-
-        .stat-label {{
-            font-size: 12px;
-            color: {c["fg_muted"]};
-        }}
-        .stat-value {{
-            font-size: 12px;
-            color: {c["fg_secondary"]};
-            font-weight: 500;
-        }}
-
-        .pace-text {{
-            font-size: 11px;
-            color: {c["fg_muted"]};
-            margin-top: 2px;
-        }}
-
-        .separator {{
-            background-color: {c["border"]};
-            min-height: 1px;
-            margin: 14px 0;
-        }}
-
-        .cost-title {{
-            font-size: 13px;
-            font-weight: 600;
-            color: {c["fg"]};
-        }}
-        .cost-detail {{
-            font-size: 12px;
-            color: {c["fg_secondary"]};
-            margin: 3px 0;
-        }}
-
-        .menu-item {{
-            padding: 10px 6px;
-            border-radius: 8px;
-            background: transparent;
-            border: none;
-        }}
-        .menu-item:hover {{
-            background-color: {c["bg_hover"]};
-        }}
-        .menu-item-text {{
-            font-size: 13px;
-            color: {c["fg"]};
-        }}
-
-        .menu-separator {{
-            background-color: {c["border"]};
-            min-height: 1px;
-            margin: 10px 0;
-        }}
-
-        .footer-item {{
-            padding: 8px 6px;
-            background: transparent;
-            border: none;
-            border-radius: 6px;
-        }}
-        .footer-item:hover {{
-            background-color: {c["bg_hover"]};
-        }}
-        .footer-text {{
-            font-size: 12px;
-            color: {c["fg_muted"]};
-        }}
-
-        progressbar trough {{
-            background-color: {c["progress_bg"]};
-            border-radius: 3px;
-            min-height: 6px;
-        }}
-        progressbar progress {{
-            border-radius: 3px;
-            min-height: 6px;
-            background-color: {c["progress_green"]};
-        }}
-        progressbar.warning progress {{
-            background-color: {c["progress_yellow"]};
-        }}
-        progressbar.error progress {{
-            background-color: {c["progress_red"]};
-        }}
-
-        .error-text {{
-            color: {c["fg_muted"]};
-            font-size: 13px;
-        }}
-
-        .settings-dialog {{
-            background-color: {c["bg"]};
-        }}
-        .settings-label {{
-            font-size: 13px;
-            font-weight: 500;
-            color: {c["fg"]};
-        }}
-        """.encode('utf-8')
+        name = theme_manager.theme
+        css = self._CSS_CACHE.get(name)
+        if css is None:
+            css = self._CSS_CACHE[name] = self._build_css(theme_manager.colors)
+        return css
+
+    def _build_css(self, c: dict) -> bytes:
+        return _CSS_TEMPLATE.substitute(c).encode('utf-8')
 
     def _apply_css(self):
-        self.style_provider = Gtk.CssProvider()
-        self.style_provider.load_from_data(self._get_css())
+        """Attach the current theme's stylesheet provider, swapping out the previous one"""
+        cls = type(self)
+        name = theme_manager.theme
+        if cls._applied_theme == name:
+            return
+
+        provider = cls._style_providers.get(name)
+        if provider is None:
+            provider = cls._style_providers[name] = Gtk.CssProvider()
+            provider.load_from_data(self._get_css())
+
+        screen = Gdk.Screen.get_default()
+        if cls._applied_theme is not None:
+            Gtk.StyleContext.remove_provider_for_screen(
+                screen, cls._style_providers[cls._applied_theme])
         Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            self.style_provider,
+            screen,
+            provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        cls._applied_theme = name
+
+    def _window_path(self, ctx, width: int, height: int, radius: float = 12):
+        """Rounded outline of the window, traced once per size"""
+        path = self._path_cache.get((width, height))
+        if path is None:
+            ctx.new_path()
+            ctx.arc(radius, radius, radius, math.pi, 1.5 * math.pi)
+            ctx.arc(width - radius, radius, radius, 1.5 * math.pi, 2 * math.pi)
+            ctx.arc(width - radius, height - radius, radius, 0, 0.5 * math.pi)
+            ctx.arc(radius, height - radius, radius, 0.5 * math.pi, math.pi)
+            ctx.close_path()
+            path = self._path_cache[(width, height)] = ctx.copy_path()
+        return path
 
     def _on_draw(self, widget, ctx):
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
-        c = theme_manager.colors
-
-        # Draw rounded rectangle with shadow effect
-        radius = 12
+        rgb = theme_manager.rgb
 
-        # Shadow (subtle)
-        ctx.set_source_rgba(0, 0, 0, 0.3)
-        ctx.new_path()
-        ctx.arc(radius + 2, radius + 2, radius, math.pi, 1.5 * math.pi)
-        ctx.arc(width - radius + 2, radius + 2, radius, 1.5 * math.pi, 2 * math.pi)
-        ctx.arc(width - radius + 2, height - radius + 2, radius, 0, 0.5 * math.pi)
-        ctx.arc(radius + 2, height - radius + 2, radius, 0.5 * math.pi, math.pi)
-        ctx.close_path()
-        ctx.fill()
+        # Draw rounded rectangle; the compositor provides the window shadow
+        outline = self._window_path(ctx, width, height)
 
         # Main background
         ctx.new_path()
-        ctx.arc(radius, radius, radius, math.pi, 1.5 * math.pi)
-        ctx.arc(width - radius, radius, radius, 1.5 * math.pi, 2 * math.pi)
-        ctx.arc(width - radius, height - radius, radius, 0, 0.5 * math.pi)
-        ctx.arc(radius, height - radius, radius, 0.5 * math.pi, math.pi)
-        ctx.close_path()
+        ctx.append_path(outline)
         ctx.clip()
 
-        # Parse background color
-        bg = c["bg"].lstrip('#')
-        r, g, b = int(bg[0:2], 16)/255, int(bg[2:4], 16)/255, int(bg[4:6], 16)/255
+        r, g, b = rgb["bg"]
         ctx.set_source_rgba(r, g, b, 0.98)
         ctx.paint()
 
         # Subtle border
-        border = c["border"].lstrip('#')
-        br, bg_c, bb = int(border[0:2], 16)/255, int(border[2:4], 16)/255, int(border[4:6], 16)/255
-        ctx.set_source_rgba(br, bg_c, bb, 0.5)
+        r, g, b = rgb["border"]
+        ctx.set_source_rgba(r, g, b, 0.5)
         ctx.set_line_width(1)
         ctx.new_path()
-        ctx.arc(radius, radius, radius, math.pi, 1.5 * math.pi)
-        ctx.arc(width - radius, radius, radius, 1.5 * math.pi, 2 * math.pi)
-        ctx.arc(width - radius, height - radius, radius, 0, 0.5 * math.pi)
-        ctx.arc(radius, height - radius, radius, 0.5 * math.pi, math.pi)
-        ctx.close_path()
+        ctx.append_path(outline)
         ctx.stroke()
 
         return False
@@ -1311,9 +2155,16 @@ class AIUsageMonitorWindow(Gtk.Window):
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scroll.set_min_content_height(400)
 
-        self.content_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self._populate_content()
-        scroll.add(self.content_container)
+        # One page per provider, built the first time its tab is shown
+        self.content_stack = Gtk.Stack()
+        self.content_stack.set_transition_type(Gtk.StackTransitionType.NONE)
+        self._pages: Dict[str, dict] = {}
+        # Built pages whose stats changed while they were not visible
+        self._stale_pages = set()
+        # Stats signature each page was last updated from
+        self._last_sig: Dict[str, Optional[tuple]] = {}
+        self._show_page(self.current_provider)
+        scroll.add(self.content_stack)
         main_box.pack_start(scroll, True, True, 0)
 
         main_box.pack_start(self._create_footer(), False, False, 0)
@@ -1360,34 +2211,30 @@ class AIUsageMonitorWindow(Gtk.Window):
             indicator = Gtk.DrawingArea()
             indicator.set_size_request(60, 3)
 
+            rgb = theme_manager.rgb
             if provider_id in self.providers and self.providers[provider_id].is_connected:
                 pct = self.providers[provider_id].session_used_pct
-                c = theme_manager.colors
                 if pct < 50:
-                    color = self._parse_color(c["progress_green"])
+                    color = rgb["progress_green"]
                 elif pct < 80:
-                    color = self._parse_color(c["progress_yellow"])
+                    color = rgb["progress_yellow"]
                 else:
-                    color = self._parse_color(c["progress_red"])
+                    color = rgb["progress_red"]
             else:
-                color = self._parse_color(theme_manager.colors["fg_muted"])
+                color = rgb["fg_muted"]
 
-            indicator.connect("draw", lambda w, ctx, col=color: self._draw_indicator(w, ctx, col))
+            indicator.color = color
+            indicator.connect("draw", self._draw_indicator)
             tab_box.pack_start(indicator, False, False, 0)
 
             tab_bar.pack_start(tab_box, False, False, 0)
 
         return tab_bar
 
-    def _parse_color(self, color_str: str) -> tuple:
-        """Parse hex color to RGB tuple"""
-        color = color_str.lstrip('#')
-        return (int(color[0:2], 16)/255, int(color[2:4], 16)/255, int(color[4:6], 16)/255)
-
-    def _draw_indicator(self, widget, ctx, color):
+    def _draw_indicator(self, widget, ctx):
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
-        ctx.set_source_rgb(*color)
+        ctx.set_source_rgb(*widget.color)
         # Rounded indicator
         radius = height / 2
         ctx.arc(radius, radius, radius, 0.5 * math.pi, 1.5 * math.pi)
@@ -1404,52 +2251,57 @@ class AIUsageMonitorWindow(Gtk.Window):
                 ctx.remove_class("active")
 
         self.current_provider = provider_id
-        self._populate_content()
-
-    def _populate_content(self):
-        for child in self.content_container.get_children():
-            self.content_container.remove(child)
+        self._show_page(provider_id)
+
+    def _show_page(self, provider_id: str):
+        """Switch the content stack to a provider, building its page on first use"""
+        if provider_id not in self._pages:
+            self._pages[provider_id] = self._build_provider_page(provider_id)
+            self._last_sig[provider_id] = self._stats_signature(self.providers.get(provider_id))
+            self._refresh_page(provider_id)
+        elif provider_id in self._stale_pages:
+            self._refresh_page(provider_id)
+        else:
+            self._refresh_time_labels(provider_id)
+        self.content_stack.set_visible_child_name(provider_id)
 
+    def _build_provider_page(self, provider_id: str) -> dict:
+        """Build a provider's content widgets; _refresh_page() fills in the values"""
+        page = {}
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         content.get_style_context().add_class("content-area")
 
-        stats = self.providers.get(self.current_provider)
+        page["not_connected"], page["not_connected_refs"] = self._create_not_connected()
+        content.pack_start(page["not_connected"], False, False, 0)
 
-        if stats is None or not stats.is_connected:
-            content.pack_start(self._create_not_connected(stats), False, False, 0)
-        else:
-            content.pack_start(self._create_provider_header(stats), False, False, 0)
-
-            sep = Gtk.Separator()
-            sep.get_style_context().add_class("separator")
-            content.pack_start(sep, False, False, 0)
-
-            # Session usage
-            content.pack_start(self._create_usage_section(
-                "Session",
-                stats.session_used_pct,
-                stats.session_reset_time,
-            ), False, False, 0)
-
-            # Weekly usage
-            content.pack_start(self._create_usage_section(
-                "Weekly",
-                stats.weekly_used_pct,
-                stats.weekly_reset_time,
-                pace_text=f"Pace: {stats.pace_status}" if stats.pace_status != "On track" else None
-            ), False, False, 0)
-
-            # Model-specific quotas
-            for model_name, usage_pct in stats.model_usage.items():
-                content.pack_start(self._create_model_section(model_name, usage_pct), False, False, 0)
-
-            # Extra usage
-            if stats.extra_usage_enabled:
-                content.pack_start(self._create_extra_usage_section(stats), False, False, 0)
+        connected = page["connected"] = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        header, page["header_refs"] = self._create_provider_header()
+        connected.pack_start(header, False, False, 0)
+
+        sep = Gtk.Separator()
+        sep.get_style_context().add_class("separator")
+        connected.pack_start(sep, False, False, 0)
+
+        # Session and weekly usage
+        section, page["session_refs"] = self._create_usage_section("Session")
+        connected.pack_start(section, False, False, 0)
+        section, page["weekly_refs"] = self._create_usage_section("Weekly")
+        connected.pack_start(section, False, False, 0)
+
+        # Model-specific quotas; rows are rebuilt only when the models change
+        page["models_box"] = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        page["model_refs"] = {}
+        connected.pack_start(page["models_box"], False, False, 0)
 
-            # Cost tracking
-            if stats.cost_30_days > 0 or stats.cost_today > 0:
-                content.pack_start(self._create_cost_section(stats), False, False, 0)
+        # Extra usage
+        page["extra"], page["extra_refs"] = self._create_extra_usage_section()
+        connected.pack_start(page["extra"], False, False, 0)
+
+        # Cost tracking
+        page["cost"], page["cost_refs"] = self._create_cost_section()
+        connected.pack_start(page["cost"], False, False, 0)
+
+        content.pack_start(connected, False, False, 0)
 
         sep2 = Gtk.Separator()
         sep2.get_style_context().add_class("menu-separator")
@@ -1457,140 +2309,231 @@ class AIUsageMonitorWindow(Gtk.Window):
 
         content.pack_start(self._create_menu_items(), False, False, 0)
 
-        self.content_container.pack_start(content, False, False, 0)
-        self.content_container.show_all()
+        self.content_stack.add_named(content, provider_id)
+        content.show_all()
+
+        # From here on visibility of the optional parts is driven by the
+        # stats, so keep the window's show_all() from overriding it
+        for widget in (page["not_connected"], connected, page["extra"], page["cost"],
+                       page["session_refs"]["reset"], page["session_refs"]["pace"],
+                       page["weekly_refs"]["reset"], page["weekly_refs"]["pace"]):
+            widget.set_no_show_all(True)
+
+        return page
+
+    def _refresh_page(self, provider_id: str):
+        """Update the existing widgets of a provider page from its stats"""
+        self._stale_pages.discard(provider_id)
+        page = self._pages[provider_id]
+        stats = self.providers.get(provider_id)
+        connected = stats is not None and stats.is_connected
+        page["not_connected"].set_visible(not connected)
+        page["connected"].set_visible(connected)
+
+        if not connected:
+            self._update_not_connected(page["not_connected_refs"], provider_id, stats)
+            return
+
+        # Read every displayed field once; the helpers take plain values
+        (name, plan, updated_at, session_pct, session_reset, weekly_pct, weekly_reset,
+         pace, models, extra_on, extra_current, extra_limit, extra_pct,
+         cost_today, tokens_today, cost_30_days, tokens_30_days) = (
+            stats.provider_name, stats.plan_name, stats.last_update_monotonic,
+            stats.session_used_pct, stats.session_reset_time,
+            stats.weekly_used_pct, stats.weekly_reset_time, stats.pace_status,
+            stats.model_usage, stats.extra_usage_enabled, stats.extra_usage_current,
+            stats.extra_usage_limit, stats.extra_usage_pct,
+            stats.cost_today, stats.cost_today_tokens,
+            stats.cost_30_days, stats.cost_30_days_tokens,
+        )
+
+        self._update_provider_header(page["header_refs"], name, plan, updated_at)
+        self._update_usage_section(page["session_refs"], session_pct, session_reset)
+        self._update_usage_section(
+            page["weekly_refs"],
+            weekly_pct,
+            weekly_reset,
+            pace_text=f"Pace: {pace}" if pace != "On track" else None
+        )
+        self._update_model_sections(page, models)
+
+        page["extra"].set_visible(extra_on)
+        if extra_on:
+            self._update_extra_usage_section(page["extra_refs"], extra_current, extra_limit, extra_pct)
+
+        show_cost = cost_30_days > 0 or cost_today > 0
+        page["cost"].set_visible(show_cost)
+        if show_cost:
+            self._update_cost_section(page["cost_refs"], cost_today, tokens_today,
+                                      cost_30_days, tokens_30_days)
 
-    def _create_not_connected(self, stats: Optional[ProviderStats]) -> Gtk.Box:
+    def _refresh_time_labels(self, provider_id: str):
+        """Update only the "Updated ..." and "Resets in ..." labels of a page"""
+        stats = self.providers.get(provider_id)
+        if stats is None or not stats.is_connected:
+            return
+        page = self._pages[provider_id]
+        page["header_refs"]["update"].set_label(self._updated_text(stats.last_update_monotonic))
+        for refs, reset_time in ((page["session_refs"], stats.session_reset_time),
+                                 (page["weekly_refs"], stats.weekly_reset_time)):
+            if reset_time:
+                refs["reset"].set_label(self._reset_text(reset_time))
+
+    def _set_progress(self, progress: Gtk.ProgressBar, percentage: float):
+        """Set a usage bar's fill and its warning/error color class"""
+        progress.set_fraction(min(1.0, percentage / 100))
+        style = progress.get_style_context()
+        if percentage >= 80:
+            style.remove_class("warning")
+            style.add_class("error")
+        elif percentage >= 50:
+            style.remove_class("error")
+            style.add_class("warning")
+        else:
+            style.remove_class("error")
+            style.remove_class("warning")
+
+    def _create_not_connected(self) -> Tuple[Gtk.Box, dict]:
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         box.set_margin_top(30)
         box.set_margin_bottom(30)
 
-        title = Gtk.Label()
-        c = theme_manager.colors
-        title.set_markup(f"<span size='large' weight='bold' foreground='{c['fg']}'>{self.current_provider.title()}</span>")
-        title.set_halign(Gtk.Align.START)
+        title = _mklabel()
         box.pack_start(title, False, False, 0)
 
-        error_msg = stats.error_message if stats else f"{self.current_provider.title()} not configured"
-        msg = Gtk.Label(label=error_msg)
-        msg.get_style_context().add_class("error-text")
-        msg.set_halign(Gtk.Align.START)
+        msg = _mklabel(css_class="error-text")
         msg.set_line_wrap(True)
         box.pack_start(msg, False, False, 8)
 
-        return box
+        return box, {"title": title, "message": msg}
 
-    def _create_provider_header(self, stats: ProviderStats) -> Gtk.Box:
+    def _update_not_connected(self, refs: dict, provider_id: str, stats: Optional[ProviderStats]):
+        c = theme_manager.colors
+        name = provider_id.title()
+        refs["title"].set_markup(
+            f"<span size='large' weight='bold' foreground='{c['fg']}'>{name}</span>")
+        error_msg = stats.error_message if stats else f"{name} not configured"
+        refs["message"].set_label(error_msg)
+
+    def _create_provider_header(self) -> Tuple[Gtk.Box, dict]:
         header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
 
         left = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
 
-        name = Gtk.Label()
-        name.set_markup(f"<span size='large' weight='bold'>{stats.provider_name}</span>")
-        name.get_style_context().add_class("provider-header")
-        name.set_halign(Gtk.Align.START)
+        name = _mklabel(css_class="provider-header")
         left.pack_start(name, False, False, 0)
 
-        if stats.last_update:
-            delta = datetime.now() - stats.last_update
-            if delta.seconds < 60:
-                update_text = "Updated just now"
-            elif delta.seconds < 3600:
-                update_text = f"Updated {delta.seconds // 60}m ago"
-            else:
-                update_text = f"Updated {delta.seconds // 3600}h ago"
-        else:
-            update_text = "Not updated"
-
-        update = Gtk.Label(label=update_text)
-        update.get_style_context().add_class("update-time")
-        update.set_halign(Gtk.Align.START)
+        update = _mklabel(css_class="update-time")
         left.pack_start(update, False, False, 0)
 
         header.pack_start(left, True, True, 0)
 
-        plan = Gtk.Label(label=stats.plan_name)
-        plan.get_style_context().add_class("plan-badge")
+        plan = _mklabel(css_class="plan-badge", halign=None)
         plan.set_valign(Gtk.Align.START)
         header.pack_end(plan, False, False, 0)
 
-        return header
+        return header, {"name": name, "update": update, "plan": plan}
+
+    def _update_provider_header(self, refs: dict, name: str, plan: str,
+                                updated_at: Optional[float]):
+        refs["name"].set_markup(f"<span size='large' weight='bold'>{name}</span>")
+
+        refs["update"].set_label(self._updated_text(updated_at))
+        refs["plan"].set_label(plan)
 
-    def _create_usage_section(self, title: str, percentage: float,
-                              reset_time: Optional[datetime], pace_text: str = None) -> Gtk.Box:
+    @staticmethod
+    def _updated_text(updated_at: Optional[float]) -> str:
+        if updated_at is None:
+            return "Not updated"
+        delta = int(time.monotonic() - updated_at)
+        if delta < 60:
+            return "Updated just now"
+        if delta < 3600:
+            return f"Updated {delta // 60}m ago"
+        return f"Updated {delta // 3600}h ago"
+
+    def _create_usage_section(self, title: str) -> Tuple[Gtk.Box, dict]:
         section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         section.set_margin_top(14)
 
-        title_label = Gtk.Label(label=title)
-        title_label.get_style_context().add_class("section-title")
-        title_label.set_halign(Gtk.Align.START)
+        title_label = _mklabel(title, "section-title")
         section.pack_start(title_label, False, False, 0)
 
         progress = Gtk.ProgressBar()
-        progress.set_fraction(min(1.0, percentage / 100))
-        if percentage >= 80:
-            progress.get_style_context().add_class("error")
-        elif percentage >= 50:
-            progress.get_style_context().add_class("warning")
         section.pack_start(progress, False, False, 4)
 
         stats_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
 
-        used_label = Gtk.Label(label=f"{percentage:.0f}% used")
-        used_label.get_style_context().add_class("stat-label")
+        used_label = _mklabel(css_class="stat-label", halign=None)
         stats_row.pack_start(used_label, True, True, 0)
 
-        if reset_time:
-            now = datetime.now(timezone.utc)
-            if reset_time.tzinfo is None:
-                reset_time = reset_time.replace(tzinfo=timezone.utc)
-            delta = reset_time - now
-            if delta.days > 0:
-                reset_text = f"Resets in {delta.days}d {delta.seconds // 3600}h"
-            elif delta.seconds >= 3600:
-                reset_text = f"Resets in {delta.seconds // 3600}h {(delta.seconds % 3600) // 60}m"
-            else:
-                reset_text = f"Resets in {max(0, delta.seconds // 60)}m"
-
-            reset_label = Gtk.Label(label=reset_text)
-            reset_label.get_style_context().add_class("stat-value")
-            stats_row.pack_end(reset_label, False, False, 0)
+        reset_label = _mklabel(css_class="stat-value", halign=None)
+        stats_row.pack_end(reset_label, False, False, 0)
 
         section.pack_start(stats_row, False, False, 0)
 
-        if pace_text:
-            pace = Gtk.Label(label=pace_text)
-            pace.get_style_context().add_class("pace-text")
-            pace.set_halign(Gtk.Align.START)
-            section.pack_start(pace, False, False, 0)
+        pace = _mklabel(css_class="pace-text")
+        section.pack_start(pace, False, False, 0)
 
-        return section
+        return section, {"progress": progress, "used": used_label, "reset": reset_label, "pace": pace}
 
-    def _create_model_section(self, model_name: str, usage_pct: float) -> Gtk.Box:
+    def _update_usage_section(self, refs: dict, percentage: float,
+                              reset_time: Optional[datetime], pace_text: str = None):
+        self._set_progress(refs["progress"], percentage)
+        refs["used"].set_label(f"{percentage:.0f}% used")
+
+        if reset_time:
+            refs["reset"].set_label(self._reset_text(reset_time))
+        refs["reset"].set_visible(bool(reset_time))
+
+        if pace_text:
+            refs["pace"].set_label(pace_text)
+        refs["pace"].set_visible(bool(pace_text))
+
+    @staticmethod
+    def _reset_text(reset_time: datetime) -> str:
+        now = datetime.now(timezone.utc)
+        if reset_time.tzinfo is None:
+            reset_time = reset_time.replace(tzinfo=timezone.utc)
+        delta = reset_time - now
+        if delta.days > 0:
+            return f"Resets in {delta.days}d {delta.seconds // 3600}h"
+        if delta.seconds >= 3600:
+            return f"Resets in {delta.seconds // 3600}h {(delta.seconds % 3600) // 60}m"
+        return f"Resets in {max(0, delta.seconds // 60)}m"
+
+    def _create_model_section(self, model_name: str) -> Tuple[Gtk.Box, dict]:
         section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         section.set_margin_top(14)
 
-        title = Gtk.Label(label=model_name)
-        title.get_style_context().add_class("section-title")
-        title.set_halign(Gtk.Align.START)
+        title = _mklabel(model_name, "section-title")
         section.pack_start(title, False, False, 0)
 
         progress = Gtk.ProgressBar()
-        progress.set_fraction(min(1.0, usage_pct / 100))
-        if usage_pct >= 80:
-            progress.get_style_context().add_class("error")
-        elif usage_pct >= 50:
-            progress.get_style_context().add_class("warning")
         section.pack_start(progress, False, False, 4)
 
-        used = Gtk.Label(label=f"{usage_pct:.0f}% used")
-        used.get_style_context().add_class("stat-label")
-        used.set_halign(Gtk.Align.START)
+        used = _mklabel(css_class="stat-label")
         section.pack_start(used, False, False, 0)
 
-        return section
-
-    def _create_extra_usage_section(self, stats: ProviderStats) -> Gtk.Box:
+        return section, {"progress": progress, "used": used}
+
+    def _update_model_sections(self, page: dict, model_usage: Dict[str, float]):
+        models_box, model_refs = page["models_box"], page["model_refs"]
+        if list(model_refs) != list(model_usage):
+            for child in models_box.get_children():
+                models_box.remove(child)
+            model_refs.clear()
+            for model_name in model_usage:
+                section, model_refs[model_name] = self._create_model_section(model_name)
+                models_box.pack_start(section, False, False, 0)
+            models_box.show_all()
+
+        for model_name, usage_pct in model_usage.items():
+            refs = model_refs[model_name]
+            self._set_progress(refs["progress"], usage_pct)
+            refs["used"].set_label(f"{usage_pct:.0f}% used")
+
+    def _create_extra_usage_section(self) -> Tuple[Gtk.Box, dict]:
         section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         section.set_margin_top(18)
 
@@ -1598,30 +2541,29 @@ class AIUsageMonitorWindow(Gtk.Window):
         sep.get_style_context().add_class("separator")
         section.pack_start(sep, False, False, 0)
 
-        title = Gtk.Label(label="Extra Usage")
-        title.get_style_context().add_class("section-title")
-        title.set_halign(Gtk.Align.START)
+        title = _mklabel("Extra Usage", "section-title")
         title.set_margin_top(10)
         section.pack_start(title, False, False, 0)
 
         progress = Gtk.ProgressBar()
-        progress.set_fraction(min(1.0, stats.extra_usage_pct / 100))
         section.pack_start(progress, False, False, 4)
 
         stats_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        cost_text = f"${stats.extra_usage_current:.2f} / ${stats.extra_usage_limit:.2f}"
-        cost_label = Gtk.Label(label=cost_text)
-        cost_label.get_style_context().add_class("stat-label")
+        cost_label = _mklabel(css_class="stat-label", halign=None)
         stats_row.pack_start(cost_label, True, True, 0)
 
-        pct_label = Gtk.Label(label=f"{stats.extra_usage_pct:.0f}% used")
-        pct_label.get_style_context().add_class("stat-value")
+        pct_label = _mklabel(css_class="stat-value", halign=None)
         stats_row.pack_end(pct_label, False, False, 0)
 
         section.pack_start(stats_row, False, False, 0)
-        return section
+        return section, {"progress": progress, "cost": cost_label, "pct": pct_label}
 
-    def _create_cost_section(self, stats: ProviderStats) -> Gtk.Box:
+    def _update_extra_usage_section(self, refs: dict, current: float, limit: float, pct: float):
+        refs["progress"].set_fraction(min(1.0, pct / 100))
+        refs["cost"].set_label(f"${current:.2f} / ${limit:.2f}")
+        refs["pct"].set_label(f"{pct:.0f}% used")
+
+    def _create_cost_section(self) -> Tuple[Gtk.Box, dict]:
         section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         section.set_margin_top(18)
 
@@ -1629,25 +2571,22 @@ class AIUsageMonitorWindow(Gtk.Window):
         sep.get_style_context().add_class("separator")
         section.pack_start(sep, False, False, 0)
 
-        title = Gtk.Label(label="Cost Tracking")
-        title.get_style_context().add_class("cost-title")
-        title.set_halign(Gtk.Align.START)
+        title = _mklabel("Cost Tracking", "cost-title")
         title.set_margin_top(10)
         section.pack_start(title, False, False, 0)
 
-        today_text = f"Today: ${stats.cost_today:.2f} · {self._format_tokens(stats.cost_today_tokens)} tokens"
-        today = Gtk.Label(label=today_text)
-        today.get_style_context().add_class("cost-detail")
-        today.set_halign(Gtk.Align.START)
+        today = _mklabel(css_class="cost-detail")
         section.pack_start(today, False, False, 0)
 
-        month_text = f"30 days: ${stats.cost_30_days:.2f} · {self._format_tokens(stats.cost_30_days_tokens)} tokens"
-        month = Gtk.Label(label=month_text)
-        month.get_style_context().add_class("cost-detail")
-        month.set_halign(Gtk.Align.START)
+        month = _mklabel(css_class="cost-detail")
         section.pack_start(month, False, False, 0)
 
-        return section
+        return section, {"today": today, "month": month}
+
+    def _update_cost_section(self, refs: dict, cost_today: float, tokens_today: int,
+                             cost_30_days: float, tokens_30_days: int):
+        refs["today"].set_label(f"Today: ${cost_today:.2f} · {_format_tokens(tokens_today)} tokens")
+        refs["month"].set_label(f"30 days: ${cost_30_days:.2f} · {_format_tokens(tokens_30_days)} tokens")
 
     def _create_menu_items(self) -> Gtk.Box:
         menu = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -1666,9 +2605,7 @@ class AIUsageMonitorWindow(Gtk.Window):
             icon_lbl = Gtk.Label(label=icon)
             box.pack_start(icon_lbl, False, False, 0)
 
-            text_lbl = Gtk.Label(label=label)
-            text_lbl.get_style_context().add_class("menu-item-text")
-            text_lbl.set_halign(Gtk.Align.START)
+            text_lbl = _mklabel(label, "menu-item-text")
             box.pack_start(text_lbl, True, True, 0)
 
             btn.add(box)
@@ -1699,8 +2636,7 @@ class AIUsageMonitorWindow(Gtk.Window):
             btn.set_relief(Gtk.ReliefStyle.NONE)
             btn.get_style_context().add_class("footer-item")
 
-            text = Gtk.Label(label=label)
-            text.get_style_context().add_class("footer-text")
+            text = _mklabel(label, "footer-text", halign=None)
             btn.add(text)
             btn.connect("clicked", callback)
             btn_row.pack_start(btn, False, False, 0)
@@ -1709,15 +2645,6 @@ class AIUsageMonitorWindow(Gtk.Window):
 
         return footer
 
-    def _format_tokens(self, tokens: int) -> str:
-        if tokens >= 1_000_000_000:
-            return f"{tokens / 1_000_000_000:.1f}B"
-        elif tokens >= 1_000_000:
-            return f"{tokens / 1_000_000:.1f}M"
-        elif tokens >= 1_000:
-            return f"{tokens / 1_000:.0f}K"
-        return str(tokens)
-
     def _position_window(self):
         display = Gdk.Display.get_default()
         monitor = display.get_primary_monitor()
@@ -1731,8 +2658,7 @@ class AIUsageMonitorWindow(Gtk.Window):
 
     def _on_key_press(self, widget, event):
         if event.keyval == Gdk.KEY_Escape:
-            self.hide()
-            self.destroy()
+            self._dismiss()
             return True
         return False
 
@@ -1761,9 +2687,41 @@ class AIUsageMonitorWindow(Gtk.Window):
         elif self.current_provider == "codex":
             webbrowser.open("https://status.openai.com/")
 
+    @staticmethod
+    def _stats_signature(stats: Optional[ProviderStats]) -> Optional[tuple]:
+        """Everything a provider page displays, for cheap change detection.
+
+        The update time is left out: it changes on every collect, and the
+        time-relative labels are refreshed on their own.
+        """
+        if stats is None:
+            return None
+        return (
+            stats.is_connected, stats.error_message, stats.plan_name,
+            stats.session_used_pct, stats.session_reset_time,
+            stats.weekly_used_pct, stats.weekly_reset_time, stats.pace_status,
+            tuple(stats.model_usage.items()),
+            stats.extra_usage_enabled, stats.extra_usage_current,
+            stats.extra_usage_limit, stats.extra_usage_pct,
+            stats.cost_today, stats.cost_today_tokens,
+            stats.cost_30_days, stats.cost_30_days_tokens,
+        )
+
     def update_providers(self, providers: Dict[str, ProviderStats]):
         self.providers = providers
-        self._populate_content()
+        # Only the visible page is updated now; the others catch up when shown.
+        # Pages whose stats are unchanged only get their time labels redone.
+        for provider_id in self._pages:
+            sig = self._stats_signature(providers.get(provider_id))
+            if self._last_sig.get(provider_id) == sig:
+                if provider_id == self.current_provider:
+                    self._refresh_time_labels(provider_id)
+                continue
+            self._last_sig[provider_id] = sig
+            if provider_id == self.current_provider:
+                self._refresh_page(provider_id)
+            else:
+                self._stale_pages.add(provider_id)
 
 
 # ============================================================================
@@ -1780,19 +2738,40 @@ class AIUsageMonitorApp:
         }
         self.providers: Dict[str, ProviderStats] = {}
         self.indicator = None
+        # Persistent tray menu items per provider, built on first use
+        self._menu_items: Optional[Dict[str, Dict[str, Gtk.MenuItem]]] = None
         self.window = None
-        self.refresh_timeout_id = None
+        # One shared second-granularity timer drives all periodic work:
+        # task name -> monotonic deadline, and the GLib source armed for the earliest
+        self._deadlines: Dict[str, float] = {}
+        self._tasks = {
+            "refresh": self._on_refresh_timeout,
+            "tokens": self._on_token_refresh_timeout,
+        }
+        self._timer_id = None
+        self._pool = collect_pool
+        # Providers with a collect() currently running on the pool
+        self._in_flight = set()
+        # Providers that got a forced refresh while a collect was in flight
+        self._force_pending = set()
+        # A _flush_ui idle callback is queued
+        self._update_pending = False
+        # Consecutive failed collects per provider, for error backoff
+        self._error_streak: Dict[str, int] = {}
+        # Highest utilization when the current refresh started
+        self._last_max_used: Optional[float] = None
 
     def run(self):
-        tray_icon_path = self.icon_gen.create_tray_icon()
         self.refresh_stats()
 
+        # AppIndicator only takes an icon name or path; StatusIcon gets a pixbuf
         if HAS_APPINDICATOR:
-            self._create_indicator(tray_icon_path)
+            self._create_indicator(self.icon_gen.create_tray_icon())
         else:
-            self._create_status_icon(tray_icon_path)
+            self._create_status_icon(self.icon_gen.create_tray_pixbuf())
 
         self._start_refresh_timer()
+        self._start_token_refresh_timer()
         Gtk.main()
 
     def _create_indicator(self, icon_path: str):
@@ -1804,31 +2783,28 @@ class AIUsageMonitorApp:
         self.indicator.set_title(APP_NAME)
         self._update_indicator_menu()
 
-    def _update_indicator_menu(self):
+    def _build_indicator_menu(self):
+        """Build the tray menu once; refreshes only relabel its items"""
         menu = Gtk.Menu()
-
-        for pid, stats in self.providers.items():
-            if stats.is_connected:
-                header = Gtk.MenuItem(label=f"━━ {stats.provider_name} ({stats.plan_name}) ━━")
-                header.set_sensitive(False)
-                menu.append(header)
-
-                session = Gtk.MenuItem(label=f"  Session: {stats.session_used_pct:.0f}% used")
-                session.set_sensitive(False)
-                menu.append(session)
-
-                weekly = Gtk.MenuItem(label=f"  Weekly: {stats.weekly_used_pct:.0f}% used")
-                weekly.set_sensitive(False)
-                menu.append(weekly)
-
-                menu.append(Gtk.SeparatorMenuItem())
+        self._menu_items = {}
+
+        for pid in self.collectors:
+            items = {}
+            for key in ("header", "session", "weekly"):
+                item = Gtk.MenuItem(label="")
+                item.set_sensitive(False)
+                menu.append(item)
+                items[key] = item
+            items["separator"] = Gtk.SeparatorMenuItem()
+            menu.append(items["separator"])
+            self._menu_items[pid] = items
 
         show_item = Gtk.MenuItem(label="📊 Show Details...")
         show_item.connect("activate", lambda i: self._show_window())
         menu.append(show_item)
 
         refresh_item = Gtk.MenuItem(label="🔄 Refresh")
-        refresh_item.connect("activate", lambda i: self.refresh_stats())
+        refresh_item.connect("activate", lambda i: self.refresh_stats(force=True))
         menu.append(refresh_item)
 
         menu.append(Gtk.SeparatorMenuItem())
@@ -1840,9 +2816,24 @@ class AIUsageMonitorApp:
         menu.show_all()
         self.indicator.set_menu(menu)
 
-    def _create_status_icon(self, icon_path: str):
+    def _update_indicator_menu(self):
+        if self._menu_items is None:
+            self._build_indicator_menu()
+
+        for pid, items in self._menu_items.items():
+            stats = self.providers.get(pid)
+            connected = stats is not None and stats.is_connected
+            for item in items.values():
+                item.set_visible(connected)
+            if not connected:
+                continue
+            items["header"].set_label(f"━━ {stats.provider_name} ({stats.plan_name}) ━━")
+            items["session"].set_label(f"  Session: {stats.session_used_pct:.0f}% used")
+            items["weekly"].set_label(f"  Weekly: {stats.weekly_used_pct:.0f}% used")
+
+    def _create_status_icon(self, pixbuf: GdkPixbuf.Pixbuf):
         self.status_icon = Gtk.StatusIcon()
-        self.status_icon.set_from_file(icon_path)
+        self.status_icon.set_from_pixbuf(pixbuf)
         self.status_icon.set_tooltip_text(APP_NAME)
         self.status_icon.connect("activate", lambda i: self._show_window())
         self.status_icon.set_visible(True)
@@ -1878,23 +2869,152 @@ class AIUsageMonitorApp:
         """Clear window reference when destroyed"""
         self.window = None
 
-    def _start_refresh_timer(self):
-        if self.refresh_timeout_id:
-            GLib.source_remove(self.refresh_timeout_id)
+    def _schedule(self, task: str, delay: float):
+        """Run a task from self._tasks once, delay seconds from now"""
+        self._deadlines[task] = time.monotonic() + delay
+        self._arm_timer()
+
+    def _arm_timer(self):
+        """(Re)arm the shared timer for the earliest pending deadline.
+
+        timeout_add_seconds fires on whole-second boundaries that GLib
+        aligns across the session, so wakeups coalesce with other apps.
+        """
+        if self._timer_id:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+        if self._deadlines:
+            delay = min(self._deadlines.values()) - time.monotonic()
+            self._timer_id = GLib.timeout_add_seconds(max(1, math.ceil(delay)), self._on_timer)
+
+    def _on_timer(self) -> bool:
+        self._timer_id = None
+        # Allow a second of slack, the granularity of the timer itself
+        now = time.monotonic() + 1
+        for task in [t for t, deadline in self._deadlines.items() if deadline <= now]:
+            del self._deadlines[task]
+            self._tasks[task]()
+        self._arm_timer()
+        return False
 
+    def _start_refresh_timer(self, delay: Optional[int] = None):
+        """(Re)schedule the next refresh; each refresh schedules the one after"""
         if self.config.refresh_interval > 0:
-            self.refresh_timeout_id = GLib.timeout_add_seconds(
-                self.config.refresh_interval,
-                self._on_refresh_timeout
-            )
+            self._schedule("refresh", delay or self.config.refresh_interval)
+        elif self._deadlines.pop("refresh", None) is not None:
+            self._arm_timer()
 
-    def _on_refresh_timeout(self) -> bool:
+    def _on_refresh_timeout(self):
         self.refresh_stats()
-        return True
 
-    def refresh_stats(self):
-        for provider_id, collector in self.collectors.items():
-            self.providers[provider_id] = collector.collect()
+    def _next_refresh_delay(self) -> int:
+        """Pick the next refresh delay from current utilization and reset times.
+
+        Low utilization backs off up to 6x the base interval; usage at 80% or
+        more keeps the base cadence, a jump of more than 5 points since the
+        last refresh halves it, and an upcoming reset pulls the next refresh
+        to halfway before it so the reset is noticed promptly. While every
+        provider is failing, the delay doubles per consecutive failure.
+        """
+        base = self.config.refresh_interval
+        errors = min(self._error_streak.values(), default=0)
+        if errors:
+            return int(min(self.config.max_refresh_interval, base * (2 ** min(errors, 5))))
+
+        connected = [s for s in self.providers.values() if s.is_connected]
+        max_used = self._max_used()
+
+        delay = base * (1 + 5 * (1 - max_used / 100))
+        if max_used >= 80:
+            delay = min(delay, base)
+        if self._last_max_used is not None and abs(max_used - self._last_max_used) > 5:
+            delay = min(delay, base / 2)
+
+        now = datetime.now(timezone.utc)
+        for stats in connected:
+            for reset_time in (stats.session_reset_time, stats.weekly_reset_time):
+                if reset_time is None:
+                    continue
+                if reset_time.tzinfo is None:
+                    reset_time = reset_time.replace(tzinfo=timezone.utc)
+                remaining = (reset_time - now).total_seconds()
+                if remaining > 0:
+                    delay = min(delay, remaining * 0.5)
+
+        return int(min(self.config.max_refresh_interval, max(self.config.min_refresh_interval, delay)))
+
+    def _max_used(self) -> float:
+        """Highest session or weekly utilization across connected providers (0-100)"""
+        max_used = max((max(s.session_used_pct, s.weekly_used_pct)
+                        for s in self.providers.values() if s.is_connected), default=0.0)
+        return min(max(max_used, 0.0), 100.0)
+
+    def _start_token_refresh_timer(self):
+        """Renew OAuth tokens in the background, once now and then hourly"""
+        self._on_token_refresh_timeout()
+
+    def _on_token_refresh_timeout(self):
+        self._maybe_refresh_tokens()
+        self._schedule("tokens", TOKEN_REFRESH_CHECK_INTERVAL)
+
+    def _maybe_refresh_tokens(self):
+        for collector in self.collectors.values():
+            refresher = getattr(collector, "maybe_refresh_tokens", None)
+            if refresher is not None:
+                self._pool.submit(refresher)
+
+    def refresh_stats(self, force: bool = False):
+        """Collect fresh stats on the worker pool, one task per provider.
+
+        Results are handed back to the GTK main loop via GLib.idle_add so
+        slow networks never stall the tray menu or the details window.
+        force=True bypasses the usage response cache (explicit refresh).
+        A provider never has more than one collect in flight; a forced
+        refresh that arrives meanwhile is queued behind the running one.
+        """
+        self._last_max_used = self._max_used() if self.providers else None
+        for provider_id in self.collectors:
+            if provider_id in self._in_flight:
+                if force:
+                    self._force_pending.add(provider_id)
+                continue
+            self._submit_collect(provider_id, force)
+
+    def _submit_collect(self, provider_id: str, force: bool):
+        self._in_flight.add(provider_id)
+        future = self._pool.submit(self.collectors[provider_id].collect, force)
+        future.add_done_callback(
+            lambda f, pid=provider_id: GLib.idle_add(self._apply_stats, pid, f)
+        )
+
+    def _apply_stats(self, provider_id: str, future) -> bool:
+        """Store one provider's result and queue a UI update (main thread)"""
+        self._in_flight.discard(provider_id)
+        if provider_id in self._force_pending:
+            self._force_pending.discard(provider_id)
+            self._submit_collect(provider_id, True)
+        try:
+            stats = future.result()
+        except Exception as e:
+            print(f"Error collecting {provider_id} stats: {e}")
+            self._error_streak[provider_id] = self._error_streak.get(provider_id, 0) + 1
+        else:
+            self.providers[provider_id] = stats
+            if stats.is_connected and not stats.error_message:
+                self._error_streak[provider_id] = 0
+            else:
+                self._error_streak[provider_id] = self._error_streak.get(provider_id, 0) + 1
+
+        # Results landing close together (one per provider) share a single UI update
+        if not self._update_pending:
+            self._update_pending = True
+            GLib.idle_add(self._flush_ui)
+        return False
+
+    def _flush_ui(self) -> bool:
+        """Push the current stats to the tray menu and details window (main thread)"""
+        self._update_pending = False
+        self._start_refresh_timer(self._next_refresh_delay())
 
         if self.indicator:
             self._update_indicator_menu()
@@ -1906,9 +3026,15 @@ class AIUsageMonitorApp:
             except:
                 self.window = None
 
+        return False
+
     def _quit(self):
-        if self.refresh_timeout_id:
-            GLib.source_remove(self.refresh_timeout_id)
+        self._deadlines.clear()
+        if self._timer_id:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+        self._pool.shutdown(wait=False)
+        http_pool.close_all()
         Gtk.main_quit()
 
 
@@ -1947,8 +3073,9 @@ def print_cli_status():
     print(f"{BOLD}{CYAN}│{'AI Usage Monitor v3.1 - Theme Support':^50}│{RESET}")
     print(f"{BOLD}{CYAN}╰{'─' * 50}╯{RESET}")
 
-    for pid, collector in collectors.items():
-        stats = collector.collect()
+    results = collect_all(collectors)
+    now = datetime.now(timezone.utc)
+    for pid, stats in results.items():
         print()
         print(f"{BOLD}━━━ {stats.provider_name} ━━━{RESET}")
 
@@ -1961,7 +3088,6 @@ def print_cli_status():
         print(f"  Session   {get_bar(stats.session_used_pct)} {stats.session_used_pct:5.1f}%")
 
         if stats.session_reset_time:
-            now = datetime.now(timezone.utc)
             if stats.session_reset_time.tzinfo is None:
                 stats.session_reset_time = stats.session_reset_time.replace(tzinfo=timezone.utc)
             delta = stats.session_reset_time - now
@@ -1972,7 +3098,6 @@ def print_cli_status():
         print(f"  Weekly    {get_bar(stats.weekly_used_pct)} {stats.weekly_used_pct:5.1f}%")
 
         if stats.weekly_reset_time:
-            now = datetime.now(timezone.utc)
             if stats.weekly_reset_time.tzinfo is None:
                 stats.weekly_reset_time = stats.weekly_reset_time.replace(tzinfo=timezone.utc)
             delta = stats.weekly_reset_time - now
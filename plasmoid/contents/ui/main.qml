@@ -74,9 +74,11 @@ PlasmoidItem {
     // Path to embedded backend script
     readonly property string backendPath: Qt.resolvedUrl("../code/backend.py").toString().replace("file://", "")
 
-    function refresh() {
+    // force: have the background service collect fresh data instead of
+    // answering with its latest snapshot
+    function refresh(force) {
         root.loading = true
-        executable.connectSource("python3 " + backendPath + " --json")
+        executable.connectSource("python3 " + backendPath + " --json --service" + (force ? " --refresh" : ""))
     }
 
     // Auto refresh
@@ -123,7 +125,7 @@ PlasmoidItem {
                 PlasmaComponents.ToolButton {
                     icon.name: "view-refresh"
                     enabled: !root.loading
-                    onClicked: root.refresh()
+                    onClicked: root.refresh(true)
                     PlasmaComponents.ToolTip { text: "Refresh" }
                 }
             }